@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import io
+import os
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pygame
+
+from game import settings
+from game.ui.surfaces import to_display_format
+
+ColorLike = Tuple[int, ...]
+ProgressCallback = Callable[[int, int], None]
+
+
+@dataclass(frozen=True)
+class AssetBundle:
+    """Fonts (by size) and images (paths under ``ASSET_DIR``) preloaded together."""
+
+    fonts: Tuple[int, ...] = ()
+    images: Tuple[str, ...] = ()
+
+
+BUNDLES: Dict[str, AssetBundle] = {
+    "ui": AssetBundle(fonts=(18, 20, 22, 24, 26, 28, 32, 48)),
+}
+
+
+class PreloadJob:
+    """Progress of one bundle being loaded on a worker thread."""
+
+    def __init__(self, name: str, total: int) -> None:
+        self.name = name
+        self.total = total
+        self.loaded = 0
+        self.error: Exception | None = None
+        self._done = threading.Event()
+
+    @property
+    def progress(self) -> float:
+        return self.loaded / self.total if self.total else 1.0
+
+    @property
+    def finished(self) -> bool:
+        return self._done.is_set()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        return self._done.wait(timeout)
+
+
+class AssetManager:
+    """Shared fonts, images and static surfaces, keyed so each loads once.
+
+    Everything handed out is in display format. :meth:`preload` reads and
+    decodes a bundle's files on a worker thread; SDL surfaces and fonts are
+    only finished on the main thread, in :meth:`pump` or on first use.
+    """
+
+    def __init__(self, asset_dir: str = settings.ASSET_DIR, font_path: str | None = settings.FONT_PATH) -> None:
+        self.asset_dir = asset_dir
+        self.font_path = font_path
+        self.fonts: Dict[Tuple[str | None, int], pygame.font.Font] = {}
+        self.images: Dict[str, pygame.Surface] = {}
+        self.surfaces: Dict[str, pygame.Surface] = {}
+        self.jobs: List[PreloadJob] = []
+        self._lock = threading.Lock()
+        self._raw_images: Dict[str, pygame.Surface] = {}
+        self._font_data: Dict[str, bytes] = {}
+        self._pending_fonts: List[Tuple[str | None, int]] = []
+
+    def font(self, size: int, path: str | None = None) -> pygame.font.Font:
+        path = path or self.font_path
+        key = (path, size)
+        font = self.fonts.get(key)
+        if font is None:
+            with self._lock:
+                data = self._font_data.get(path) if path else None
+            source = io.BytesIO(data) if data is not None else path
+            font = self.fonts[key] = pygame.font.Font(source, size)
+        return font
+
+    def image(self, name: str) -> pygame.Surface:
+        image = self.images.get(name)
+        if image is None:
+            with self._lock:
+                raw = self._raw_images.pop(name, None)
+            if raw is None:
+                raw = pygame.image.load(os.path.join(self.asset_dir, name))
+            image = self.images[name] = to_display_format(raw)
+        return image
+
+    def surface(
+        self,
+        key: str,
+        size: Tuple[int, int],
+        fill: ColorLike,
+        alpha: bool = False,
+    ) -> pygame.Surface:
+        """A solid ``fill`` surface shared under ``key``; treat it as read-only."""
+        surf = self.surfaces.get(key)
+        if surf is None:
+            surf = pygame.Surface(size, pygame.SRCALPHA if alpha else 0)
+            surf.fill(fill)
+            surf = self.surfaces[key] = to_display_format(surf)
+        return surf
+
+    def preload(self, name: str, on_progress: Optional[ProgressCallback] = None) -> PreloadJob:
+        """Start loading bundle ``name`` in the background and return its job."""
+        bundle = BUNDLES[name]
+        job = PreloadJob(name, len(bundle.fonts) + len(bundle.images))
+        self.jobs.append(job)
+        thread = threading.Thread(target=self._load_bundle, args=(bundle, job, on_progress), daemon=True)
+        thread.start()
+        return job
+
+    def pump(self) -> None:
+        """Finish preloaded assets on the main thread; call once per frame."""
+        with self._lock:
+            names = list(self._raw_images)
+            fonts, self._pending_fonts = self._pending_fonts, []
+        for name in names:
+            self.image(name)
+        for path, size in fonts:
+            self.font(size, path)
+        self.jobs = [job for job in self.jobs if not job.finished]
+
+    def _load_bundle(self, bundle: AssetBundle, job: PreloadJob, on_progress: Optional[ProgressCallback]) -> None:
+        try:
+            for size in bundle.fonts:
+                path = self.font_path
+                if path and path not in self._font_data:
+                    with open(path, "rb") as handle:
+                        data = handle.read()
+                    with self._lock:
+                        self._font_data[path] = data
+                with self._lock:
+                    self._pending_fonts.append((path, size))
+                self._advance(job, on_progress)
+            for name in bundle.images:
+                raw = pygame.image.load(os.path.join(self.asset_dir, name))
+                with self._lock:
+                    self._raw_images[name] = raw
+                self._advance(job, on_progress)
+        except (OSError, pygame.error) as exc:
+            job.error = exc
+        finally:
+            job._done.set()
+
+    @staticmethod
+    def _advance(job: PreloadJob, on_progress: Optional[ProgressCallback]) -> None:
+        job.loaded += 1
+        if on_progress is not None:
+            on_progress(job.loaded, job.total)
@@ -0,0 +1,303 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+from game.core.entities import PlayerCharacter
+from game.core.initiative import REFERENCE_AGILITY, ROUND_TIME
+from game.data.enemies import ENEMIES
+
+OUTCOME_LOSS = -1
+OUTCOME_TIMEOUT = 0
+OUTCOME_WIN = 1
+
+
+@dataclass
+class BatchResult:
+    """Per-encounter outcomes of one batch of simulated fights."""
+
+    template: str
+    enemy_count: int
+    outcomes: np.ndarray
+    rounds: np.ndarray
+    damage_dealt: np.ndarray
+    damage_taken: np.ndarray
+
+    @property
+    def encounters(self) -> int:
+        return len(self.outcomes)
+
+    @property
+    def win_rate(self) -> float:
+        return float(np.mean(self.outcomes == OUTCOME_WIN))
+
+    @property
+    def loss_rate(self) -> float:
+        return float(np.mean(self.outcomes == OUTCOME_LOSS))
+
+    def rounds_to_kill(self) -> np.ndarray:
+        return self.rounds[self.outcomes == OUTCOME_WIN]
+
+    def summary(self, percentiles: Sequence[float] = (5, 50, 95)) -> Dict[str, object]:
+        kills = self.rounds_to_kill()
+        return {
+            "template": self.template,
+            "enemy_count": self.enemy_count,
+            "encounters": self.encounters,
+            "win_rate": self.win_rate,
+            "loss_rate": self.loss_rate,
+            "rounds_to_kill": _percentiles(kills, percentiles),
+            "damage_dealt": _percentiles(self.damage_dealt, percentiles),
+            "damage_taken": _percentiles(self.damage_taken, percentiles),
+        }
+
+
+def simulate_encounters(
+    heroes: Sequence[PlayerCharacter],
+    template_name: str,
+    enemy_count: int,
+    encounters: int,
+    seed: int | np.random.SeedSequence | None = None,
+    max_rounds: int = 100,
+    initiative: bool = True,
+) -> BatchResult:
+    """Fight ``encounters`` independent battles at once.
+
+    The rules follow :class:`CombatSimulator` repeated until one side falls,
+    with the same ``initiative`` switch: by default combatants act in
+    :class:`TurnScheduler` order, ``ROUND_TIME`` per round, including
+    stuns, slows and cooldowns; with ``initiative=False`` every living hero
+    strikes, then every living enemy hits. Battles still going after
+    ``max_rounds`` are reported as timeouts.
+    """
+    if initiative:
+        return _simulate_initiative(heroes, template_name, enemy_count, encounters, seed, max_rounds)
+    template = ENEMIES[template_name]
+    rng = np.random.default_rng(seed)
+    n = encounters
+    hero_str = np.array([hero.stats.get("strength", 8) for hero in heroes], dtype=np.int32)
+    hero_hp = np.tile(
+        np.array([hero.stats.get("hp", hero.max_hp) for hero in heroes], dtype=np.int32), (n, 1)
+    )
+    enemy_hp = np.full((n, enemy_count), template.hp, dtype=np.int32)
+
+    outcomes = np.zeros(n, dtype=np.int8)
+    rounds = np.full(n, max_rounds, dtype=np.int32)
+    dealt = np.zeros(n, dtype=np.int64)
+    taken = np.zeros(n, dtype=np.int64)
+    # ``index`` maps the rows still being simulated back to encounter numbers;
+    # finished rows are dropped each round so late rounds only pay for the
+    # long fights.
+    index = np.arange(n)
+
+    for round_no in range(1, max_rounds + 1):
+        m = len(index)
+        rows = np.arange(m)
+        round_dealt = np.zeros(m, dtype=np.int64)
+        round_taken = np.zeros(m, dtype=np.int64)
+        for h in range(len(heroes)):
+            enemy_alive = enemy_hp > 0
+            acting = (hero_hp[:, h] > 0) & enemy_alive.any(axis=1)
+            target = _pick_alive(rng, enemy_alive)
+            dmg = np.maximum(0, hero_str[h] + rng.integers(-2, 6, m, dtype=np.int32))
+            dmg[~acting] = 0
+            enemy_hp[rows, target] -= dmg
+            round_dealt += dmg
+        for e in range(enemy_count):
+            hero_alive = hero_hp > 0
+            acting = (enemy_hp[:, e] > 0) & hero_alive.any(axis=1)
+            target = _pick_alive(rng, hero_alive)
+            dmg = np.maximum(0, template.strength + rng.integers(-3, 5, m, dtype=np.int32))
+            dmg[~acting] = 0
+            hero_hp[rows, target] = np.maximum(0, hero_hp[rows, target] - dmg)
+            round_taken += dmg
+        dealt[index] += round_dealt
+        taken[index] += round_taken
+
+        won = ~(enemy_hp > 0).any(axis=1)
+        lost = ~won & ~(hero_hp > 0).any(axis=1)
+        outcomes[index[won]] = OUTCOME_WIN
+        outcomes[index[lost]] = OUTCOME_LOSS
+        done = won | lost
+        rounds[index[done]] = round_no
+        if done.any():
+            keep = ~done
+            index, hero_hp, enemy_hp = index[keep], hero_hp[keep], enemy_hp[keep]
+        if not len(index):
+            break
+
+    return BatchResult(template_name, enemy_count, outcomes, rounds, dealt, taken)
+
+
+def sweep(
+    heroes: Sequence[PlayerCharacter],
+    encounters: int,
+    enemy_counts: Sequence[int] = (1, 2, 3),
+    seed: int | None = None,
+    max_rounds: int = 100,
+    initiative: bool = True,
+) -> List[BatchResult]:
+    """Run :func:`simulate_encounters` for every enemy template and encounter size."""
+    jobs = [(name, count) for name in ENEMIES for count in enemy_counts]
+    seeds = np.random.SeedSequence(seed).spawn(len(jobs))
+    return [
+        simulate_encounters(heroes, name, count, encounters, job_seed, max_rounds, initiative)
+        for (name, count), job_seed in zip(jobs, seeds)
+    ]
+
+
+def _simulate_initiative(
+    heroes: Sequence[PlayerCharacter],
+    template_name: str,
+    enemy_count: int,
+    encounters: int,
+    seed: int | np.random.SeedSequence | None,
+    max_rounds: int,
+) -> BatchResult:
+    """Initiative-ordered fights, one scheduler step per iteration across all rows.
+
+    Columns ``0..H-1`` are heroes and ``H..`` enemies. Each row keeps its own
+    next-action times, push order (for :class:`TurnScheduler`'s tie-break),
+    speeds and hero cooldowns, so stuns and slows diverge per encounter.
+    """
+    template = ENEMIES[template_name]
+    rng = np.random.default_rng(seed)
+    n, h_count = encounters, len(heroes)
+    a_count = h_count + enemy_count
+    strength = np.array(
+        [hero.stats.get("strength", 8) for hero in heroes] + [template.strength] * enemy_count, dtype=np.int32
+    )
+    agility = np.array(
+        [hero.stats.get("agility", REFERENCE_AGILITY) for hero in heroes] + [template.agility] * enemy_count,
+        dtype=np.float64,
+    )
+    # Control abilities per hero, padded to the longest list.
+    controls = [
+        [ability for ability in hero.archetype.abilities if "stun" in ability.effect or "slow" in ability.effect]
+        for hero in heroes
+    ]
+    k_count = max([len(abilities) for abilities in controls] + [1])
+    valid = np.zeros((h_count, k_count), dtype=bool)
+    stun = np.zeros((h_count, k_count), dtype=np.float64)
+    slow = np.zeros((h_count, k_count), dtype=np.float64)
+    slow_turns = np.zeros((h_count, k_count), dtype=np.int32)
+    cooldown = np.zeros((h_count, k_count), dtype=np.int32)
+    for h, abilities in enumerate(controls):
+        for k, ability in enumerate(abilities):
+            valid[h, k] = True
+            stun[h, k] = ability.effect.get("stun", 0)
+            slow[h, k] = ability.effect.get("slow", 0)
+            slow_turns[h, k] = ability.effect.get("duration", 1)
+            cooldown[h, k] = ability.cooldown
+
+    hp = np.tile(
+        np.array(
+            [hero.stats.get("hp", hero.max_hp) for hero in heroes] + [template.hp] * enemy_count, dtype=np.int32
+        ),
+        (n, 1),
+    )
+    interval = ROUND_TIME * REFERENCE_AGILITY / np.maximum(1.0, agility)
+    time = np.tile(interval * ROUND_TIME / (interval + ROUND_TIME), (n, 1))
+    time[hp <= 0] = np.inf
+    order = np.tile(np.arange(a_count, dtype=np.int64), (n, 1))
+    speed = np.ones((n, a_count))
+    speed_turns = np.zeros((n, a_count), dtype=np.int32)
+    cooling = np.zeros((n, h_count, k_count), dtype=np.int32)
+    seq = a_count
+
+    outcomes = np.zeros(n, dtype=np.int8)
+    rounds = np.full(n, max_rounds, dtype=np.int32)
+    dealt = np.zeros(n, dtype=np.int64)
+    taken = np.zeros(n, dtype=np.int64)
+    index = np.arange(n)
+
+    for round_no in range(1, max_rounds + 1):
+        round_end = round_no * ROUND_TIME
+        while True:
+            alive = hp > 0
+            fighting = alive[:, :h_count].any(axis=1) & alive[:, h_count:].any(axis=1)
+            now = time.min(axis=1)
+            rows = np.flatnonzero(fighting & (now < round_end))
+            if not len(rows):
+                break
+            now = now[rows]
+            tied = time[rows] == now[:, None]
+            actor = np.where(tied, order[rows], np.iinfo(np.int64).max).argmin(axis=1)
+
+            is_hero = actor < h_count
+            hr, ha = rows[is_hero], actor[is_hero]
+            if len(hr):
+                cooling[hr, ha] = np.maximum(0, cooling[hr, ha] - 1)
+                target = h_count + _pick_alive(rng, alive[hr, h_count:])
+                dmg = np.maximum(0, strength[ha] + rng.integers(-2, 6, len(hr), dtype=np.int32))
+                hp[hr, target] -= dmg
+                dealt[index[hr]] += dmg
+                killed = hp[hr, target] <= 0
+                time[hr[killed], target[killed]] = np.inf
+                # The first ready control ability hits a surviving target.
+                ready = valid[ha] & (cooling[hr, ha] == 0)
+                use = ready.any(axis=1) & ~killed
+                ur, ua, ut = hr[use], ha[use], target[use]
+                uk = ready[use].argmax(axis=1)
+                target_interval = ROUND_TIME * REFERENCE_AGILITY / np.maximum(1.0, agility[ut] * speed[ur, ut])
+                stunned = stun[ua, uk] > 0
+                time[ur[stunned], ut[stunned]] += stun[ua, uk][stunned] * target_interval[stunned]
+                order[ur[stunned], ut[stunned]] = seq
+                slowed = slow[ua, uk] > 0
+                speed[ur[slowed], ut[slowed]] = 1 - slow[ua, uk][slowed] / 100
+                speed_turns[ur[slowed], ut[slowed]] = slow_turns[ua, uk][slowed]
+                cooling[ur, ua, uk] = cooldown[ua, uk]
+
+            er, ea = rows[~is_hero], actor[~is_hero]
+            if len(er):
+                target = _pick_alive(rng, alive[er, :h_count])
+                dmg = np.maximum(0, strength[ea] + rng.integers(-3, 5, len(er), dtype=np.int32))
+                hp[er, target] = np.maximum(0, hp[er, target] - dmg)
+                taken[index[er]] += dmg
+                fallen = hp[er, target] <= 0
+                time[er[fallen], target[fallen]] = np.inf
+
+            # Reschedule at the current speed, then count slows down.
+            time[rows, actor] = now + ROUND_TIME * REFERENCE_AGILITY / np.maximum(
+                1.0, agility[actor] * speed[rows, actor]
+            )
+            order[rows, actor] = seq + 1
+            seq += 2
+            timed = speed_turns[rows, actor] > 0
+            tr, ta = rows[timed], actor[timed]
+            speed_turns[tr, ta] -= 1
+            speed[tr[speed_turns[tr, ta] == 0], ta[speed_turns[tr, ta] == 0]] = 1.0
+
+        alive = hp > 0
+        won = ~alive[:, h_count:].any(axis=1)
+        lost = ~won & ~alive[:, :h_count].any(axis=1)
+        outcomes[index[won]] = OUTCOME_WIN
+        outcomes[index[lost]] = OUTCOME_LOSS
+        done = won | lost
+        rounds[index[done]] = round_no
+        if done.any():
+            keep = ~done
+            index, hp, time, order = index[keep], hp[keep], time[keep], order[keep]
+            speed, speed_turns, cooling = speed[keep], speed_turns[keep], cooling[keep]
+        if not len(index):
+            break
+
+    return BatchResult(template_name, enemy_count, outcomes, rounds, dealt, taken)
+
+
+def _pick_alive(rng: np.random.Generator, alive: np.ndarray) -> np.ndarray:
+    """Column index of a uniformly chosen ``True`` in each row (0 for empty rows)."""
+    count = alive.sum(axis=1)
+    choice = (rng.random(len(alive)) * count).astype(np.int32)
+    return (np.cumsum(alive, axis=1) > choice[:, None]).argmax(axis=1)
+
+
+def _percentiles(values: np.ndarray, percentiles: Sequence[float]) -> Dict[str, float]:
+    if len(values) == 0:
+        return {}
+    stats = {"mean": float(np.mean(values))}
+    for p, value in zip(percentiles, np.percentile(values, percentiles)):
+        stats[f"p{p:g}"] = float(value)
+    return stats
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
 import random
+from array import array
 from dataclasses import dataclass
-from typing import List
+from typing import IO, Dict, Generic, Iterable, Iterator, List, TypeVar
 
+from game import settings
 from game.core.entities import Enemy, PlayerCharacter
+from game.core.initiative import REFERENCE_AGILITY, ROUND_TIME, TurnScheduler
+
+T = TypeVar("T")
 
 
 @dataclass
@@ -14,40 +19,248 @@ class CombatLogEntry:
     value: int | None = None
 
     def format(self) -> str:
+        text = f"{self.actor} {self.action}" if self.action else self.actor
         if self.value is None:
-            return f"{self.actor} {self.action}"
-        return f"{self.actor} {self.action} ({self.value})"
+            return text
+        return f"{text} ({self.value})"
+
+
+class CombatLog:
+    """Fixed-capacity ring buffer of combat log records.
+
+    Actor and action strings are interned into a shared table and stored as
+    ids in typed arrays; records are only turned into text when displayed.
+    Records pushed out of the buffer are appended to ``history_path`` when
+    one is given.
+    """
+
+    NO_VALUE = -(2 ** 63)
+
+    __slots__ = (
+        "capacity",
+        "history_path",
+        "_actors",
+        "_actions",
+        "_values",
+        "_strings",
+        "_ids",
+        "_head",
+        "_size",
+        "_history",
+    )
+
+    def __init__(self, capacity: int = settings.COMBAT_LOG_CAPACITY, history_path: str | None = None) -> None:
+        self.capacity = capacity
+        self.history_path = history_path
+        self._actors = array("i", bytes(4 * capacity))
+        self._actions = array("i", bytes(4 * capacity))
+        self._values = array("q", bytes(8 * capacity))
+        self._strings: List[str] = []
+        self._ids: Dict[str, int] = {}
+        self._head = 0
+        self._size = 0
+        self._history: IO[str] | None = None
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __bool__(self) -> bool:
+        return self._size > 0
+
+    def __getitem__(self, index: int) -> CombatLogEntry:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError(index)
+        return self._entry((self._head - self._size + index) % self.capacity)
+
+    def __iter__(self) -> Iterator[CombatLogEntry]:
+        for i in range(self._size):
+            yield self[i]
+
+    def append(self, actor: str, action: str = "", value: int | None = None) -> None:
+        slot = self._head
+        if self._size == self.capacity:
+            self._spill(slot)
+        else:
+            self._size += 1
+        self._actors[slot] = self._intern(actor)
+        self._actions[slot] = self._intern(action)
+        self._values[slot] = self.NO_VALUE if value is None else value
+        self._head = (slot + 1) % self.capacity
+
+    def tail(self, count: int) -> List[str]:
+        """Format only the newest ``count`` records."""
+        start = max(0, self._size - count)
+        return [self[i].format() for i in range(start, self._size)]
+
+    def clear(self) -> None:
+        self._head = 0
+        self._size = 0
+
+    def close(self) -> None:
+        if self._history is not None:
+            self._history.close()
+            self._history = None
+
+    def _entry(self, slot: int) -> CombatLogEntry:
+        value = self._values[slot]
+        return CombatLogEntry(
+            self._strings[self._actors[slot]],
+            self._strings[self._actions[slot]],
+            None if value == self.NO_VALUE else value,
+        )
+
+    def _intern(self, text: str) -> int:
+        string_id = self._ids.get(text)
+        if string_id is None:
+            string_id = self._ids[text] = len(self._strings)
+            self._strings.append(text)
+        return string_id
+
+    def _spill(self, slot: int) -> None:
+        if self.history_path is None:
+            return
+        if self._history is None:
+            self._history = open(self.history_path, "a", encoding="utf-8")
+        self._history.write(self._entry(slot).format() + "\n")
+
+
+class Roster(Generic[T]):
+    """Living combatants packed into a list with O(1) swap-removal.
+
+    Members are tracked by identity, so removal and membership tests do not
+    scan the list and random targeting is a single index.
+    """
+
+    def __init__(self, members: Iterable[T] = ()) -> None:
+        self.members: List[T] = list(members)
+        self._slots: Dict[int, int] = {id(member): i for i, member in enumerate(self.members)}
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.members)
+
+    def __contains__(self, member: object) -> bool:
+        return id(member) in self._slots
+
+    def add(self, member: T) -> None:
+        self._slots[id(member)] = len(self.members)
+        self.members.append(member)
+
+    def remove(self, member: T) -> None:
+        slot = self._slots.pop(id(member))
+        last = self.members.pop()
+        if last is not member:
+            self.members[slot] = last
+            self._slots[id(last)] = slot
+
+    def choice(self, rng: random.Random | None = None) -> T:
+        return (rng or random).choice(self.members)
+
+    def snapshot(self) -> List[T]:
+        return list(self.members)
 
 
 class CombatSimulator:
-    def __init__(self, party: List[PlayerCharacter], enemies: List[Enemy]) -> None:
-        self.party = party
-        self.enemies = enemies
-        self.log: List[CombatLogEntry] = []
+    """Resolves fights between the party and a group of enemies.
+
+    With ``initiative`` (the default) combatants act in agility order from a
+    :class:`TurnScheduler`, and each call to :meth:`run_round` plays out
+    ``ROUND_TIME`` of combat. Without it every hero acts, then every enemy.
+    """
+
+    def __init__(
+        self,
+        party: List[PlayerCharacter],
+        enemies: List[Enemy],
+        log: CombatLog | None = None,
+        initiative: bool = True,
+        rng: random.Random | None = None,
+    ) -> None:
+        self.party: Roster[PlayerCharacter] = Roster(party)
+        self.enemies: Roster[Enemy] = Roster(enemies)
+        self.log = log if log is not None else CombatLog()
         self.defeated: List[Enemy] = []
+        self.initiative = initiative
+        self.rng = rng or random.Random()
+        self.scheduler = TurnScheduler()
+        self.round_end = 0.0
+        if initiative:
+            for hero in self.party:
+                self.scheduler.add(hero, hero.stats.get("agility", REFERENCE_AGILITY))
+            for enemy in self.enemies:
+                self.scheduler.add(enemy, enemy.agility)
+
+    def add_enemies(self, enemies: Iterable[Enemy]) -> None:
+        """Bring a new wave into the fight."""
+        for enemy in enemies:
+            self.enemies.add(enemy)
+            if self.initiative:
+                self.scheduler.add(enemy, enemy.agility)
 
     def run_round(self) -> None:
-        for hero in list(self.party):
+        if not self.initiative:
+            self._run_phased_round()
+            return
+        self.round_end += ROUND_TIME
+        while self.party and self.enemies and self.scheduler.peek_time() < self.round_end:
+            actor = self.scheduler.pop()
+            if isinstance(actor, Enemy):
+                self._enemy_turn(actor)
+            else:
+                self._hero_turn(actor)
+            self.scheduler.reschedule(actor)
+
+    def _run_phased_round(self) -> None:
+        for hero in self.party.snapshot():
             if not self.enemies:
                 break
-            target = random.choice(self.enemies)
-            dmg = max(0, hero.stats.get("strength", 8) + random.randint(-2, 5))
-            target.hp -= dmg
-            self.log.append(CombatLogEntry(hero.codename, "strikes", dmg))
-            if not target.is_alive():
-                self.log.append(CombatLogEntry(target.name, "is defeated"))
-                self.enemies.remove(target)
-                self.defeated.append(target)
-        for enemy in list(self.enemies):
+            self._hero_turn(hero)
+        for enemy in self.enemies.snapshot():
             if not self.party:
                 break
-            target = random.choice(self.party)
-            dmg = max(0, enemy.strength + random.randint(-3, 4))
-            target.stats["hp"] = max(0, target.stats.get("hp", target.max_hp) - dmg)
-            self.log.append(CombatLogEntry(enemy.name, f"hits {target.codename}", dmg))
-            if target.stats.get("hp", 0) <= 0:
-                self.log.append(CombatLogEntry(target.codename, "falls in battle"))
-                self.party.remove(target)
+            self._enemy_turn(enemy)
+
+    def _hero_turn(self, hero: PlayerCharacter) -> None:
+        target = self.enemies.choice(self.rng)
+        dmg = max(0, hero.stats.get("strength", 8) + self.rng.randint(-2, 5))
+        target.hp -= dmg
+        self.log.append(hero.codename, "strikes", dmg)
+        if not target.is_alive():
+            self.log.append(target.name, "is defeated")
+            self.enemies.remove(target)
+            self.scheduler.remove(target)
+            self.defeated.append(target)
+        elif self.initiative:
+            self._use_control_ability(hero, target)
+        # After the strike, so an N-turn buff boosts N actions.
+        hero.tick_buffs()
+
+    def _use_control_ability(self, hero: PlayerCharacter, target: Enemy) -> None:
+        for ability in hero.archetype.abilities:
+            effect = ability.effect
+            if not ("stun" in effect or "slow" in effect) or not self.scheduler.ready(hero, ability.name):
+                continue
+            if "stun" in effect:
+                self.scheduler.stun(target, effect["stun"])
+            if "slow" in effect:
+                self.scheduler.haste(target, 1 - effect["slow"] / 100, effect.get("duration", 1))
+            self.scheduler.start_cooldown(hero, ability.name, ability.cooldown)
+            self.log.append(hero.codename, f"uses {ability.name}")
+            return
+
+    def _enemy_turn(self, enemy: Enemy) -> None:
+        target = self.party.choice(self.rng)
+        dmg = max(0, enemy.strength + self.rng.randint(-3, 4))
+        target.stats["hp"] = max(0, target.stats.get("hp", target.max_hp) - dmg)
+        self.log.append(enemy.name, f"hits {target.codename}", dmg)
+        if target.stats.get("hp", 0) <= 0:
+            self.log.append(target.codename, "falls in battle")
+            self.party.remove(target)
+            self.scheduler.remove(target)
 
     def victory(self) -> bool:
         return not self.enemies
@@ -2,11 +2,16 @@ from __future__ import annotations
 
 import random
 from dataclasses import dataclass, field
-from typing import Dict, List
+from typing import Dict, Iterable, List
 
+from game.core.stats import ModifierStack
 from game.data.classes import Archetype, BASE_ARCHETYPES
 from game.data.items import ITEMS
 
+# Stats that double as a current amount (combat writes damage into
+# ``stats["hp"]``). Modifier changes shift them instead of rebuilding them.
+POOL_STATS = ("hp", "mana")
+
 
 @dataclass
 class Skill:
@@ -26,6 +31,8 @@ class PlayerCharacter:
     stats: Dict[str, int] = field(default_factory=dict)
     equipped: Dict[str, str] = field(default_factory=dict)
     learned_skills: List[Skill] = field(default_factory=list)
+    modifiers: ModifierStack = field(default_factory=ModifierStack, init=False, repr=False, compare=False)
+    bonuses: Dict[str, int] = field(default_factory=dict, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         if not self.base_stats:
@@ -34,19 +41,69 @@ class PlayerCharacter:
 
     @property
     def max_hp(self) -> int:
-        return self.stats.get("hp", 100) + self.level * 5
+        return self.base_stats.get("hp", 100) + self.bonuses.get("hp", 0) + self.level * 5
 
     @property
     def max_mana(self) -> int:
-        return self.stats.get("mana", 60) + self.level * 4
+        return self.base_stats.get("mana", 60) + self.bonuses.get("mana", 0) + self.level * 4
 
     def recalculate_stats(self) -> None:
+        """Rebuild ``stats`` from scratch, re-reading ``equipped`` and ``learned_skills``.
+
+        Pools such as hp are refilled. Timed buffs survive the rebuild. Prefer :meth:`equip`,
+        :meth:`learn_skill` and :meth:`add_buff`, which only recompute the
+        stats they change.
+        """
+        self.modifiers.clear_permanent()
+        for slot, item_name in self.equipped.items():
+            if item_name:
+                self.modifiers.set(f"equipment:{slot}", ITEMS[item_name].stats)
+        for skill in self.learned_skills:
+            self.modifiers.set(f"skill:{skill.name}", self._skill_stats(skill))
         self.stats = dict(self.base_stats)
-        for item_name in self.equipped.values():
-            if not item_name:
-                continue
-            for key, value in ITEMS[item_name].stats.items():
-                self.stats[key] = self.stats.get(key, 0) + value
+        self.bonuses = {}
+        self._refresh({stat for modifiers in self.modifiers.sources.values() for stat in modifiers})
+
+    def equip(self, slot: str, item_name: str) -> None:
+        """Put ``item_name`` in ``slot`` (``""`` empties it)."""
+        self.equipped[slot] = item_name
+        self._refresh(self.modifiers.set(f"equipment:{slot}", ITEMS[item_name].stats if item_name else {}))
+
+    def learn_skill(self, skill: Skill) -> None:
+        if skill in self.learned_skills:
+            return
+        self.learned_skills.append(skill)
+        self._refresh(self.modifiers.set(f"skill:{skill.name}", self._skill_stats(skill)))
+
+    def add_buff(self, name: str, modifiers: Dict[str, int], turns: int) -> None:
+        """Apply ``modifiers`` for ``turns`` calls of :meth:`tick_buffs`; reapplying refreshes it."""
+        self._refresh(self.modifiers.set(f"buff:{name}", modifiers, turns))
+
+    def tick_buffs(self, turns: int = 1) -> None:
+        touched = self.modifiers.tick(turns)
+        if touched:
+            self._refresh(touched)
+
+    def _skill_stats(self, skill: Skill) -> Dict[str, int]:
+        # Only modifiers naming a base stat change stats; the rest (damage,
+        # cooldown, ...) parameterise the skill itself.
+        return {key: value for key, value in skill.modifiers.items() if key in self.base_stats}
+
+    def _refresh(self, touched: Iterable[str]) -> None:
+        for stat in touched:
+            total = self.modifiers.total(stat)
+            change = total - self.bonuses.pop(stat, 0)
+            affected = self.modifiers.affects(stat)
+            if affected:
+                self.bonuses[stat] = total
+            if stat in POOL_STATS and stat in self.stats:
+                current = self.stats[stat]
+                # Losing a bonus never knocks out a standing hero.
+                self.stats[stat] = max(1, current + change) if current > 0 else current
+            elif stat in self.base_stats or affected:
+                self.stats[stat] = self.base_stats.get(stat, 0) + total
+            else:
+                self.stats.pop(stat, None)
 
     def summary(self) -> str:
         return (
@@ -57,8 +114,8 @@ class PlayerCharacter:
         )
 
 
-def generate_party(seed: int | None = None) -> List[PlayerCharacter]:
-    rng = random.Random(seed)
+def generate_party(seed: int | None = None, rng: random.Random | None = None) -> List[PlayerCharacter]:
+    rng = rng or random.Random(seed)
     archetypes = list(BASE_ARCHETYPES.values())
     rng.shuffle(archetypes)
     party: List[PlayerCharacter] = []
@@ -106,12 +163,12 @@ class Enemy:
         return self.hp > 0
 
 
-def instantiate_enemy(template_name: str) -> Enemy:
+def instantiate_enemy(template_name: str, rng: random.Random | None = None) -> Enemy:
     from game.data.enemies import ENEMIES
 
     template = ENEMIES[template_name]
     hp = template.hp
-    gold = random.randint(template.loot.gold_range.start, template.loot.gold_range.stop)
+    gold = (rng or random).randint(template.loot.gold_range.start, template.loot.gold_range.stop)
     xp = int((template.hp + template.strength * 4 + template.focus * 3) / 4)
     return Enemy(
         name=template.name,
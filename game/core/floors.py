@@ -0,0 +1,147 @@
+"""Memory-mapped archive of the floors generated during a run.
+
+The file is a small header followed by one fixed-layout record per floor::
+
+    file header   magic, version, floor count
+    floor header  width, height, room count, generation seed
+    rooms         room count x (x, y, width, height) int32
+    tiles         width * height uint8
+    explored      width * height uint8 (0/1)
+
+Records are padded to 8 bytes. Loading a floor maps the file and returns
+NumPy views into it, so revisiting a floor copies nothing, and edits to
+tiles or explored state write straight back to the archive.
+"""
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+from dataclasses import dataclass
+from typing import List, Tuple
+
+import numpy as np
+
+from game.core.world import Room, TileGrid
+
+MAGIC = b"TDFL"
+VERSION = 1
+FILE_HEADER = struct.Struct("<4sHHI")
+FLOOR_HEADER = struct.Struct("<IIIq")
+ROOM = struct.Struct("<iiii")
+ALIGN = 8
+
+
+@dataclass
+class Floor:
+    grid: TileGrid
+    rooms: List[Room]
+    explored: np.ndarray
+    seed: int
+
+
+class FloorArchive:
+    def __init__(self, path: str, reset: bool = False) -> None:
+        self.path = path
+        if reset or not os.path.exists(path) or os.path.getsize(path) < FILE_HEADER.size:
+            # Replace rather than truncate: floors still mapped from the old
+            # file stay valid until they are dropped.
+            with open(f"{path}.tmp", "wb") as handle:
+                handle.write(FILE_HEADER.pack(MAGIC, VERSION, 0, 0))
+            os.replace(f"{path}.tmp", path)
+        self._file = open(path, "r+b")
+        self._map: mmap.mmap | None = None
+        self.offsets: List[int] = []
+        try:
+            self._scan()
+        except (struct.error, ValueError) as exc:
+            self._file.close()
+            raise ValueError(f"{path} is corrupt: {exc}") from exc
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def append(self, grid: TileGrid, rooms: List[Room], seed: int = 0, explored: np.ndarray | None = None) -> int:
+        """Store a floor at the end of the archive and return its index."""
+        height, width = grid.tiles.shape
+        if explored is None:
+            explored = np.zeros((height, width), dtype=bool)
+        parts = [FLOOR_HEADER.pack(width, height, len(rooms), seed)]
+        parts += [ROOM.pack(room.x, room.y, room.width, room.height) for room in rooms]
+        parts += [grid.tiles.tobytes(), explored.astype(np.uint8).tobytes()]
+        record = b"".join(parts)
+        record += b"\0" * (-len(record) % ALIGN)
+
+        offset = self._end()
+        self._file.seek(offset)
+        self._file.write(record)
+        self.offsets.append(offset)
+        self._file.seek(0)
+        self._file.write(FILE_HEADER.pack(MAGIC, VERSION, 0, len(self.offsets)))
+        self._file.flush()
+        # Views handed out earlier keep the old mapping alive; new loads use a
+        # mapping that covers the grown file.
+        self._map = None
+        return len(self.offsets) - 1
+
+    def load(self, index: int) -> Floor:
+        mapped = self._mapped()
+        offset = self.offsets[index]
+        width, height, room_count, seed = FLOOR_HEADER.unpack_from(mapped, offset)
+        offset += FLOOR_HEADER.size
+        corners = np.frombuffer(mapped, dtype="<i4", count=room_count * 4, offset=offset).reshape(room_count, 4)
+        rooms = [Room(*room) for room in corners.tolist()]
+        offset += room_count * ROOM.size
+        size = width * height
+        tiles = np.frombuffer(mapped, dtype=np.uint8, count=size, offset=offset).reshape(height, width)
+        explored = np.frombuffer(mapped, dtype=np.bool_, count=size, offset=offset + size).reshape(height, width)
+        return Floor(TileGrid.from_array(tiles), rooms, explored, seed)
+
+    def flush(self) -> None:
+        if self._map is not None:
+            self._map.flush()
+
+    def close(self) -> None:
+        """Flush and release the file; floors already loaded stay readable."""
+        self.flush()
+        self._map = None
+        self._file.close()
+
+    def _mapped(self) -> mmap.mmap:
+        if self._map is None:
+            self._map = mmap.mmap(self._file.fileno(), 0)
+        return self._map
+
+    def _end(self) -> int:
+        if not self.offsets:
+            return _aligned(FILE_HEADER.size)
+        width, height, room_count, _ = self._header_at(self.offsets[-1])
+        return self.offsets[-1] + _record_size(width, height, room_count)
+
+    def _header_at(self, offset: int) -> Tuple[int, int, int, int]:
+        self._file.seek(offset)
+        return FLOOR_HEADER.unpack(self._file.read(FLOOR_HEADER.size))
+
+    def _scan(self) -> None:
+        self._file.seek(0)
+        magic, version, _, count = FILE_HEADER.unpack(self._file.read(FILE_HEADER.size))
+        if magic != MAGIC:
+            raise ValueError(f"{self.path} is not a floor archive")
+        if version != VERSION:
+            raise ValueError(f"Unsupported floor archive version {version}")
+        size = os.fstat(self._file.fileno()).st_size
+        offset = _aligned(FILE_HEADER.size)
+        for _ in range(count):
+            self.offsets.append(offset)
+            width, height, room_count, _ = self._header_at(offset)
+            offset += _record_size(width, height, room_count)
+            if offset > size:
+                raise ValueError("floor record runs past the end of the file")
+
+
+def _aligned(size: int) -> int:
+    return size + (-size % ALIGN)
+
+
+def _record_size(width: int, height: int, room_count: int) -> int:
+    return _aligned(FLOOR_HEADER.size + room_count * ROOM.size + 2 * width * height)
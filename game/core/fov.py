@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from typing import List, Tuple
+
+import numpy as np
+
+from game import settings
+from game.core.world import TILE_FLOOR, TileGrid
+
+Region = Tuple[int, int, int, int]
+
+# Transforms mapping the shadowcaster's local (dx, dy) into each octant.
+OCTANTS = (
+    (1, 0, 0, 1),
+    (0, 1, 1, 0),
+    (0, -1, 1, 0),
+    (-1, 0, 0, 1),
+    (-1, 0, 0, -1),
+    (0, -1, -1, 0),
+    (0, 1, -1, 0),
+    (1, 0, 0, -1),
+)
+
+
+class FieldOfView:
+    """Visible and explored bitmaps for a grid, from recursive shadowcasting.
+
+    Both arrays share the grid's ``(height, width)`` shape. :meth:`update` only
+    recasts when the viewer enters another tile or the grid is edited, and
+    records the tile region whose state changed in :attr:`changed` so overlays
+    can be patched instead of rebuilt.
+    """
+
+    def __init__(
+        self,
+        grid: TileGrid,
+        radius: int = settings.FOV_RADIUS,
+        explored: np.ndarray | None = None,
+    ) -> None:
+        self.grid = grid
+        self.radius = radius
+        self.visible = np.zeros(grid.tiles.shape, dtype=bool)
+        # An existing bitmap (e.g. a floor archive view) is updated in place.
+        self.explored = explored if explored is not None else np.zeros(grid.tiles.shape, dtype=bool)
+        self.origin: Tuple[int, int] | None = None
+        self.changed: Region | None = None
+        self._window: Region | None = None
+        self._grid_version = -1
+
+    def update(self, origin: Tuple[int, int]) -> bool:
+        """Recast from ``origin`` if needed; returns ``True`` when anything was recomputed."""
+        if origin == self.origin and self.grid.version == self._grid_version:
+            return False
+        self.origin = origin
+        self._grid_version = self.grid.version
+        window = self._window_around(origin)
+        x0, y0, x1, y1 = window
+        lit = cast_light(self.grid.tiles[y0:y1, x0:x1].tolist(), origin[0] - x0, origin[1] - y0, self.radius)
+
+        previous = self._window
+        if previous is not None:
+            px0, py0, px1, py1 = previous
+            self.visible[py0:py1, px0:px1] = False
+        self.visible[y0:y1, x0:x1] = lit
+        self.explored[y0:y1, x0:x1] |= lit
+        self._window = window
+        self.changed = window if previous is None else _union(previous, window)
+        return True
+
+    def is_visible(self, x: int, y: int) -> bool:
+        return self.grid.in_bounds(x, y) and bool(self.visible[y, x])
+
+    def _window_around(self, origin: Tuple[int, int]) -> Region:
+        x, y = origin
+        r = self.radius
+        return (
+            max(0, x - r),
+            max(0, y - r),
+            min(self.grid.width, x + r + 1),
+            min(self.grid.height, y + r + 1),
+        )
+
+
+def cast_light(tiles: List[List[int]], ox: int, oy: int, radius: int) -> np.ndarray:
+    """Tiles visible from ``(ox, oy)`` within ``radius`` in a row-major tile window.
+
+    Anything other than floor blocks sight; walls at the edge of the light are
+    themselves visible.
+    """
+    height = len(tiles)
+    width = len(tiles[0]) if height else 0
+    lit = np.zeros((height, width), dtype=bool)
+    if not (0 <= ox < width and 0 <= oy < height):
+        return lit
+    lit[oy, ox] = True
+    for xx, xy, yx, yy in OCTANTS:
+        _cast(tiles, lit, ox, oy, 1, 1.0, 0.0, radius, xx, xy, yx, yy)
+    return lit
+
+
+def _cast(
+    tiles: List[List[int]],
+    lit: np.ndarray,
+    ox: int,
+    oy: int,
+    row: int,
+    start: float,
+    end: float,
+    radius: int,
+    xx: int,
+    xy: int,
+    yx: int,
+    yy: int,
+) -> None:
+    if start < end:
+        return
+    height, width = lit.shape
+    radius_sq = radius * radius
+    new_start = 0.0
+    for j in range(row, radius + 1):
+        dx, dy = -j - 1, -j
+        blocked = False
+        while dx <= 0:
+            dx += 1
+            x = ox + dx * xx + dy * xy
+            y = oy + dx * yx + dy * yy
+            left_slope = (dx - 0.5) / (dy + 0.5)
+            right_slope = (dx + 0.5) / (dy - 0.5)
+            if start < right_slope:
+                continue
+            if end > left_slope:
+                break
+            inside = 0 <= x < width and 0 <= y < height
+            if inside and dx * dx + dy * dy < radius_sq:
+                lit[y, x] = True
+            opaque = not inside or tiles[y][x] != TILE_FLOOR
+            if blocked:
+                if opaque:
+                    new_start = right_slope
+                    continue
+                blocked = False
+                start = new_start
+            elif opaque and j < radius:
+                blocked = True
+                _cast(tiles, lit, ox, oy, j + 1, start, left_slope, radius, xx, xy, yx, yy)
+                new_start = right_slope
+        if blocked:
+            break
+
+
+def _union(a: Region, b: Region) -> Region:
+    return min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3])
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+from typing import Dict, Hashable, List, Tuple
+
+ROUND_TIME = 100.0
+REFERENCE_AGILITY = 12
+
+
+class _Turn:
+    __slots__ = ("actor", "agility", "time", "version", "speed", "speed_turns", "cooldowns")
+
+    def __init__(self, actor: object, agility: int) -> None:
+        self.actor = actor
+        self.agility = agility
+        self.time = 0.0
+        self.version = 0
+        self.speed = 1.0
+        self.speed_turns = 0
+        self.cooldowns: Dict[Hashable, int] = {}
+
+
+class TurnScheduler:
+    """Orders combat actions on a min-heap keyed by next-action time.
+
+    An actor with agility ``REFERENCE_AGILITY`` acts once per ``ROUND_TIME``;
+    faster actors act proportionally more often. Every actor's first turn
+    falls inside the first ``ROUND_TIME``, still in agility order. Stuns
+    re-key a single heap entry, and superseded or removed entries are skipped
+    lazily when popped, so every operation is O(log n) in the roster size.
+    """
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self._turns: Dict[int, _Turn] = {}
+        self._heap: List[Tuple[float, int, int, _Turn]] = []
+        self._order = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._turns)
+
+    def __contains__(self, actor: object) -> bool:
+        return id(actor) in self._turns
+
+    def add(self, actor: object, agility: int) -> None:
+        turn = _Turn(actor, agility)
+        self._turns[id(actor)] = turn
+        # Harmonic blend of the interval and a round: shorter than both, and
+        # still ordered by agility.
+        interval = self.interval(actor)
+        self._push(turn, self.now + interval * ROUND_TIME / (interval + ROUND_TIME))
+
+    def remove(self, actor: object) -> None:
+        self._turns.pop(id(actor), None)
+        if len(self._heap) > 64 and len(self._heap) > 2 * len(self._turns):
+            self._compact()
+
+    def interval(self, actor: object) -> float:
+        turn = self._turns[id(actor)]
+        return ROUND_TIME * REFERENCE_AGILITY / max(1.0, turn.agility * turn.speed)
+
+    def peek_time(self) -> float:
+        self._drop_stale()
+        return self._heap[0][0] if self._heap else float("inf")
+
+    def pop(self) -> object:
+        """Advance the clock to the next action and return the actor taking it.
+
+        The actor is not rescheduled until :meth:`reschedule` is called.
+        """
+        self._drop_stale()
+        time, _, _, turn = heapq.heappop(self._heap)
+        self.now = time
+        for key, remaining in list(turn.cooldowns.items()):
+            if remaining <= 1:
+                del turn.cooldowns[key]
+            else:
+                turn.cooldowns[key] = remaining - 1
+        turn.version += 1
+        return turn.actor
+
+    def reschedule(self, actor: object) -> None:
+        turn = self._turns.get(id(actor))
+        if turn is not None:
+            self._push(turn, self.now + self.interval(actor))
+            if turn.speed_turns:
+                turn.speed_turns -= 1
+                if not turn.speed_turns:
+                    turn.speed = 1.0
+
+    def stun(self, actor: object, turns: int) -> None:
+        """Push the actor's next action back by ``turns`` of its own intervals."""
+        turn = self._turns.get(id(actor))
+        if turn is not None:
+            self._push(turn, turn.time + turns * self.interval(actor))
+
+    def haste(self, actor: object, factor: float, turns: int) -> None:
+        """Scale the waits after the actor's next ``turns`` actions by ``1 / factor`` (< 1 slows).
+
+        The action already scheduled keeps its time.
+        """
+        turn = self._turns.get(id(actor))
+        if turn is not None:
+            turn.speed = factor
+            turn.speed_turns = turns
+
+    def start_cooldown(self, actor: object, key: Hashable, turns: int) -> None:
+        turn = self._turns.get(id(actor))
+        if turn is not None and turns > 0:
+            turn.cooldowns[key] = turns
+
+    def ready(self, actor: object, key: Hashable) -> bool:
+        turn = self._turns.get(id(actor))
+        return turn is not None and key not in turn.cooldowns
+
+    def _push(self, turn: _Turn, time: float) -> None:
+        turn.time = time
+        turn.version += 1
+        heapq.heappush(self._heap, (time, next(self._order), turn.version, turn))
+
+    def _drop_stale(self) -> None:
+        heap = self._heap
+        while heap:
+            _, _, version, turn = heap[0]
+            if version == turn.version and self._turns.get(id(turn.actor)) is turn:
+                return
+            heapq.heappop(heap)
+
+    def _compact(self) -> None:
+        self._heap = [
+            item for item in self._heap
+            if item[2] == item[3].version and self._turns.get(id(item[3].actor)) is item[3]
+        ]
+        heapq.heapify(self._heap)
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import heapq
+from collections import deque
+from typing import Dict, List, Tuple
+
+from game import settings
+from game.core.streaming import StreamingWorld
+from game.core.world import TileGrid
+
+Tile = Tuple[int, int]
+NEIGHBOURS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+
+def astar(
+    grid: TileGrid | StreamingWorld,
+    start: Tile,
+    goal: Tile,
+    max_nodes: int = 20000,
+) -> List[Tile] | None:
+    """Shortest 4-connected path from ``start`` to ``goal``, inclusive.
+
+    Returns ``None`` when the goal is unreachable or more than ``max_nodes``
+    tiles would have to be expanded to find it.
+    """
+    if not grid.is_walkable(*goal):
+        return None
+    gx, gy = goal
+    came_from: Dict[Tile, Tile | None] = {start: None}
+    cost: Dict[Tile, int] = {start: 0}
+    frontier = [(abs(start[0] - gx) + abs(start[1] - gy), 0, start)]
+    expanded = 0
+    while frontier:
+        _, g, tile = heapq.heappop(frontier)
+        if tile == goal:
+            path = [tile]
+            while came_from[path[-1]] is not None:
+                path.append(came_from[path[-1]])
+            return path[::-1]
+        if g > cost[tile]:
+            continue
+        expanded += 1
+        if expanded > max_nodes:
+            return None
+        x, y = tile
+        for dx, dy in NEIGHBOURS:
+            nxt = (x + dx, y + dy)
+            if cost.get(nxt, g + 2) <= g + 1 or not grid.is_walkable(*nxt):
+                continue
+            cost[nxt] = g + 1
+            came_from[nxt] = tile
+            heapq.heappush(frontier, (g + 1 + abs(nxt[0] - gx) + abs(nxt[1] - gy), g + 1, nxt))
+    return None
+
+
+class FlowField:
+    """Distance field toward one target tile, shared by every pursuer.
+
+    :meth:`update` only rebuilds the field when the target moves to another
+    tile or the grid is edited; followers then pick their next tile with a
+    handful of dictionary lookups instead of running their own search.
+    """
+
+    def __init__(self, grid: TileGrid | StreamingWorld, radius: int = settings.FLOW_FIELD_RADIUS) -> None:
+        self.grid = grid
+        self.radius = radius
+        self.target: Tile | None = None
+        self.distances: Dict[Tile, int] = {}
+        self._grid_version = -1
+
+    def update(self, target: Tile) -> bool:
+        """Point the field at ``target``; returns ``True`` if it had to be rebuilt."""
+        if target == self.target and self.grid.version == self._grid_version:
+            return False
+        self.target = target
+        self._grid_version = self.grid.version
+        self.distances = self._build(target)
+        return True
+
+    def distance(self, tile: Tile) -> int | None:
+        return self.distances.get(tile)
+
+    def next_tile(self, tile: Tile) -> Tile | None:
+        """The neighbour of ``tile`` one step closer to the target, if any."""
+        here = self.distances.get(tile)
+        if not here:
+            return None
+        x, y = tile
+        for dx, dy in NEIGHBOURS:
+            nxt = (x + dx, y + dy)
+            if self.distances.get(nxt, here) < here:
+                return nxt
+        return None
+
+    def _build(self, target: Tile) -> Dict[Tile, int]:
+        # Uniform step costs, so breadth-first order is Dijkstra order.
+        if not self.grid.is_walkable(*target):
+            return {}
+        is_walkable = self.grid.is_walkable
+        distances = {target: 0}
+        queue = deque([target])
+        while queue:
+            tile = queue.popleft()
+            d = distances[tile] + 1
+            if d > self.radius:
+                continue
+            x, y = tile
+            for dx, dy in NEIGHBOURS:
+                nxt = (x + dx, y + dy)
+                if nxt not in distances and is_walkable(*nxt):
+                    distances[nxt] = d
+                    queue.append(nxt)
+        return distances
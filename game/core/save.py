@@ -0,0 +1,340 @@
+"""Versioned binary save files.
+
+A save is a fixed header (magic, format version, CRC32 of the body) followed
+by a zlib-compressed body of little-endian ``struct`` fields. Saves are taken
+in two steps so autosaves never stall a frame: :func:`snapshot` copies what
+it needs on the main thread (a memcpy for the tile grid), and
+:func:`encode` plus the atomic file write run on an :class:`Autosaver`
+thread.
+"""
+from __future__ import annotations
+
+import os
+import queue
+import struct
+import threading
+import zlib
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+from game.core.entities import PlayerCharacter, skill_catalogue
+from game.core.world import Room, TileGrid
+from game.data.classes import BASE_ARCHETYPES
+from game.data.items import ITEMS
+
+MAGIC = b"TDSV"
+VERSION = 3
+HEADER = struct.Struct("<4sHI")
+
+WORLD_NONE = 0
+WORLD_GRID = 1
+WORLD_STREAMING = 2
+
+Position = Tuple[float, float]
+
+
+@dataclass
+class HeroRecord:
+    codename: str
+    archetype: str
+    level: int
+    xp: int
+    base_stats: Dict[str, int]
+    stats: Dict[str, int]
+    equipped: Dict[str, str]
+    skills: List[str]
+
+
+@dataclass
+class WorldRecord:
+    kind: int = WORLD_NONE
+    floor: int = 0
+    floor_seed: int = 0
+    width: int = 0
+    height: int = 0
+    tiles: bytes = b""
+    world_seed: int = 0
+    rooms: List[Room] = field(default_factory=list)
+    player_pos: Position = (0.0, 0.0)
+    pursuers: List[Position] = field(default_factory=list)
+
+
+@dataclass
+class SaveData:
+    seed: int
+    gold: int
+    party: List[HeroRecord]
+    inventory: Dict[str, int]
+    unlocked_skills: Dict[str, List[str]]
+    world: WorldRecord = field(default_factory=WorldRecord)
+
+
+def snapshot(app: "GameApp") -> SaveData:
+    """Copy everything a save needs, so it can be encoded off the main thread."""
+    party = [snapshot_hero(hero) for hero in app.player_party]
+    world = WorldRecord()
+    state = app.state_machine.states.get("world")
+    if state is not None and state.grid is not None:
+        world.player_pos = (state.player_pos.x, state.player_pos.y)
+        world.pursuers = [(pos.x, pos.y) for pos in state.pursuers]
+        world.rooms = [Room(room.x, room.y, room.width, room.height) for room in state.rooms]
+        if isinstance(state.grid, TileGrid):
+            world.kind = WORLD_GRID
+            world.floor = state.floor
+            world.floor_seed = state.floor_seed
+            world.width, world.height = state.grid.width, state.grid.height
+            world.tiles = state.grid.to_bytes()
+        else:
+            world.kind = WORLD_STREAMING
+            world.world_seed = state.grid.world_seed
+    return SaveData(
+        seed=app.rng.seed,
+        gold=app.gold,
+        party=party,
+        inventory=dict(app.inventory),
+        unlocked_skills={key: list(names) for key, names in app.unlocked_skills.items()},
+        world=world,
+    )
+
+
+def snapshot_hero(hero: PlayerCharacter) -> HeroRecord:
+    return HeroRecord(
+        hero.codename,
+        hero.archetype.name,
+        hero.level,
+        hero.xp,
+        dict(hero.base_stats),
+        dict(hero.stats),
+        {slot: name for slot, name in hero.equipped.items() if name},
+        [skill.name for skill in hero.learned_skills],
+    )
+
+
+def restore_party(records: List[HeroRecord]) -> List[PlayerCharacter]:
+    skills = {skill.name: skill for skill in skill_catalogue()}
+    party = []
+    for record in records:
+        if record.archetype not in BASE_ARCHETYPES:
+            raise ValueError(f"Unknown archetype {record.archetype!r} in save")
+        for item_name in record.equipped.values():
+            if item_name and item_name not in ITEMS:
+                raise ValueError(f"Unknown item {item_name!r} in save")
+        hero = PlayerCharacter(
+            codename=record.codename,
+            archetype=BASE_ARCHETYPES[record.archetype],
+            level=record.level,
+            xp=record.xp,
+            base_stats=dict(record.base_stats),
+            equipped=dict(record.equipped),
+            learned_skills=[skills[name] for name in record.skills if name in skills],
+        )
+        # __post_init__ recalculated stats from gear; keep the saved values (current hp).
+        hero.stats = dict(record.stats)
+        party.append(hero)
+    return party
+
+
+def encode(data: SaveData) -> bytes:
+    out = _Writer()
+    out.pack("<qq", data.seed, data.gold)
+    out.u32(len(data.party))
+    for hero in data.party:
+        out.text(hero.codename)
+        out.text(hero.archetype)
+        out.pack("<II", hero.level, hero.xp)
+        out.int_map(hero.base_stats)
+        out.int_map(hero.stats)
+        out.u32(len(hero.equipped))
+        for slot, name in hero.equipped.items():
+            out.text(slot)
+            out.text(name)
+        out.texts(hero.skills)
+    out.int_map(data.inventory)
+    out.u32(len(data.unlocked_skills))
+    for key, names in data.unlocked_skills.items():
+        out.text(key)
+        out.texts(names)
+
+    world = data.world
+    out.pack("<B", world.kind)
+    if world.kind != WORLD_NONE:
+        out.pack("<dd", *world.player_pos)
+        out.u32(len(world.pursuers))
+        for pos in world.pursuers:
+            out.pack("<dd", *pos)
+        out.u32(len(world.rooms))
+        for room in world.rooms:
+            out.pack("<iiii", room.x, room.y, room.width, room.height)
+    if world.kind == WORLD_GRID:
+        out.pack("<IqII", world.floor, world.floor_seed, world.width, world.height)
+        out.parts.append(world.tiles)
+    elif world.kind == WORLD_STREAMING:
+        out.pack("<q", world.world_seed)
+
+    body = zlib.compress(b"".join(out.parts), 6)
+    return HEADER.pack(MAGIC, VERSION, zlib.crc32(body)) + body
+
+
+def decode(blob: bytes) -> SaveData:
+    """Parse a save; any damage to the file is reported as ``ValueError``."""
+    try:
+        return _decode(blob)
+    except (struct.error, zlib.error, UnicodeDecodeError) as exc:
+        raise ValueError("Save file is corrupt") from exc
+
+
+def _decode(blob: bytes) -> SaveData:
+    magic, version, crc = HEADER.unpack_from(blob)
+    if magic != MAGIC:
+        raise ValueError("Not a save file")
+    if not 1 <= version <= VERSION:
+        raise ValueError(f"Unsupported save version {version}")
+    body = blob[HEADER.size:]
+    if zlib.crc32(body) != crc:
+        raise ValueError("Save file is corrupt")
+    src = _Reader(zlib.decompress(body))
+
+    seed, gold = src.unpack("<qq")
+    party = []
+    for _ in range(src.u32()):
+        codename, archetype = src.text(), src.text()
+        level, xp = src.unpack("<II")
+        base_stats, stats = src.int_map(), src.int_map()
+        equipped = {src.text(): src.text() for _ in range(src.u32())}
+        party.append(HeroRecord(codename, archetype, level, xp, base_stats, stats, equipped, src.texts()))
+    inventory = src.int_map()
+    unlocked = {src.text(): src.texts() for _ in range(src.u32())}
+
+    world = WorldRecord(kind=src.unpack("<B")[0])
+    if world.kind != WORLD_NONE:
+        world.player_pos = src.unpack("<dd")
+        world.pursuers = [src.unpack("<dd") for _ in range(src.u32())]
+        world.rooms = [Room(*src.unpack("<iiii")) for _ in range(src.u32())]
+    if world.kind == WORLD_GRID:
+        # Version 1 predates the floor archive and only ever saved floor 0;
+        # version 2 did not record the floor's seed.
+        if version >= 2:
+            (world.floor,) = src.unpack("<I")
+        if version >= 3:
+            (world.floor_seed,) = src.unpack("<q")
+        world.width, world.height = src.unpack("<II")
+        world.tiles = src.raw(world.width * world.height)
+    elif world.kind == WORLD_STREAMING:
+        (world.world_seed,) = src.unpack("<q")
+    return SaveData(seed, gold, party, inventory, unlocked, world)
+
+
+def write_atomic(path: str, blob: bytes) -> None:
+    """Write ``blob`` to ``path`` so readers see either the old file or the new one."""
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as handle:
+        handle.write(blob)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(tmp, path)
+
+
+def save(path: str, data: SaveData) -> None:
+    write_atomic(path, encode(data))
+
+
+def load(path: str) -> SaveData:
+    with open(path, "rb") as handle:
+        return decode(handle.read())
+
+
+class Autosaver:
+    """Encodes and writes snapshots on a worker thread.
+
+    Only the newest pending snapshot is kept: if saves are requested faster
+    than the disk keeps up, stale ones are dropped rather than queued.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.saves_written = 0
+        self.error: Exception | None = None
+        self._pending: "queue.Queue[SaveData | None]" = queue.Queue(maxsize=1)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, data: SaveData) -> None:
+        try:
+            self._pending.get_nowait()
+        except queue.Empty:
+            pass
+        self._pending.put_nowait(data)
+
+    def close(self) -> None:
+        """Write whatever is pending, then stop the worker; a no-op once it has stopped."""
+        if not self._thread.is_alive():
+            return
+        self._pending.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            data = self._pending.get()
+            if data is None:
+                return
+            try:
+                save(self.path, data)
+                self.saves_written += 1
+            except Exception as exc:
+                # Keep the worker alive; a bad snapshot must not stop later saves.
+                self.error = exc
+
+
+class _Writer:
+    def __init__(self) -> None:
+        self.parts: List[bytes] = []
+
+    def pack(self, fmt: str, *values) -> None:
+        self.parts.append(struct.pack(fmt, *values))
+
+    def u32(self, value: int) -> None:
+        self.parts.append(struct.pack("<I", value))
+
+    def text(self, value: str) -> None:
+        data = value.encode("utf-8")
+        self.parts.append(struct.pack("<H", len(data)) + data)
+
+    def texts(self, values: List[str]) -> None:
+        self.u32(len(values))
+        for value in values:
+            self.text(value)
+
+    def int_map(self, values: Dict[str, int]) -> None:
+        self.u32(len(values))
+        for key, value in values.items():
+            self.text(key)
+            self.parts.append(struct.pack("<q", value))
+
+
+class _Reader:
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+        self.offset = 0
+
+    def unpack(self, fmt: str) -> tuple:
+        values = struct.unpack_from(fmt, self.data, self.offset)
+        self.offset += struct.calcsize(fmt)
+        return values
+
+    def u32(self) -> int:
+        return self.unpack("<I")[0]
+
+    def raw(self, size: int) -> bytes:
+        data = self.data[self.offset:self.offset + size]
+        self.offset += size
+        return data
+
+    def text(self) -> str:
+        (size,) = self.unpack("<H")
+        return self.raw(size).decode("utf-8")
+
+    def texts(self) -> List[str]:
+        return [self.text() for _ in range(self.u32())]
+
+    def int_map(self) -> Dict[str, int]:
+        return {self.text(): self.unpack("<q")[0] for _ in range(self.u32())}
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from typing import Dict, Set
+
+
+class ModifierStack:
+    """Stat modifiers grouped by source, e.g. ``"equipment:weapon"`` or ``"buff:Aegis"``.
+
+    Every change reports the stats it touched, so the owner can recompute
+    just those. Sources added with a ``duration`` expire after that many
+    :meth:`tick` calls; the rest stay until replaced or removed.
+    """
+
+    def __init__(self) -> None:
+        self.sources: Dict[str, Dict[str, int]] = {}
+        self.durations: Dict[str, int] = {}
+
+    def set(self, source: str, modifiers: Dict[str, int], duration: int | None = None) -> Set[str]:
+        """Replace ``source``'s modifiers; returns the stats whose totals may have changed."""
+        touched = set(self.sources.get(source, ()))
+        touched.update(modifiers)
+        if modifiers:
+            self.sources[source] = dict(modifiers)
+        else:
+            self.sources.pop(source, None)
+        if duration is not None and modifiers:
+            self.durations[source] = duration
+        else:
+            self.durations.pop(source, None)
+        return touched
+
+    def remove(self, source: str) -> Set[str]:
+        return self.set(source, {})
+
+    def tick(self, turns: int = 1) -> Set[str]:
+        """Count down timed sources and drop expired ones; returns the stats they touched."""
+        if not self.durations:
+            return set()
+        touched: Set[str] = set()
+        for source in list(self.durations):
+            self.durations[source] -= turns
+            if self.durations[source] <= 0:
+                touched |= self.remove(source)
+        return touched
+
+    def clear_permanent(self) -> None:
+        """Drop every source without a duration."""
+        for source in [source for source in self.sources if source not in self.durations]:
+            del self.sources[source]
+
+    def total(self, stat: str) -> int:
+        return sum(modifiers.get(stat, 0) for modifiers in self.sources.values())
+
+    def affects(self, stat: str) -> bool:
+        return any(stat in modifiers for modifiers in self.sources.values())
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import pathlib
+import random
+from collections import OrderedDict
+from typing import Dict, Iterator, Tuple
+
+import numpy as np
+
+from game import settings
+from game.core.world import TILE_FLOOR, TileGrid, carve_hallway, generate_dungeon
+
+
+class StreamingWorld:
+    """Unbounded dungeon stitched together from lazily generated chunks.
+
+    Each chunk is generated from ``(world_seed, chunk_x, chunk_y)`` alone, so
+    it can be dropped and rebuilt identically at any time. At most
+    ``max_chunks`` are held in memory; edited chunks are written to
+    ``spill_dir`` on eviction instead of being regenerated.
+    """
+
+    width = None
+    height = None
+
+    def __init__(
+        self,
+        world_seed: int,
+        chunk_size: int = settings.STREAM_CHUNK_TILES,
+        max_chunks: int = settings.STREAM_MAX_CHUNKS,
+        spill_dir: str | None = None,
+    ) -> None:
+        self.world_seed = world_seed
+        self.chunk_size = chunk_size
+        self.max_chunks = max_chunks
+        self.spill_dir = pathlib.Path(spill_dir) if spill_dir else None
+        self.version = 0
+        self.chunks: "OrderedDict[Tuple[int, int], TileGrid]" = OrderedDict()
+        self._generated_version: Dict[Tuple[int, int], int] = {}
+
+    def chunk_of(self, x: int, y: int) -> Tuple[int, int]:
+        return x // self.chunk_size, y // self.chunk_size
+
+    def chunk(self, cx: int, cy: int) -> TileGrid:
+        key = (cx, cy)
+        grid = self.chunks.get(key)
+        if grid is not None:
+            self.chunks.move_to_end(key)
+            return grid
+        grid = self._load(cx, cy)
+        if grid is None:
+            grid = self._generate(cx, cy)
+        self.chunks[key] = grid
+        self._generated_version[key] = grid.version
+        while len(self.chunks) > self.max_chunks:
+            self._evict(next(iter(self.chunks)))
+        return grid
+
+    def ensure_around(self, x: int, y: int, radius: int = 1) -> None:
+        """Make sure every chunk within ``radius`` chunks of tile ``(x, y)`` is resident."""
+        ccx, ccy = self.chunk_of(x, y)
+        for cy in range(ccy - radius, ccy + radius + 1):
+            for cx in range(ccx - radius, ccx + radius + 1):
+                self.chunk(cx, cy)
+
+    def tile(self, x: int, y: int) -> int:
+        size = self.chunk_size
+        return int(self.chunk(x // size, y // size).tiles[y % size, x % size])
+
+    def is_walkable(self, x: int, y: int) -> bool:
+        return self.tile(x, y) == TILE_FLOOR
+
+    def region(self, x1: int, y1: int, x2: int, y2: int) -> np.ndarray:
+        out = np.empty((y2 - y1, x2 - x1), dtype=np.uint8)
+        size = self.chunk_size
+        for cy in range(y1 // size, (y2 - 1) // size + 1):
+            for cx in range(x1 // size, (x2 - 1) // size + 1):
+                ox, oy = cx * size, cy * size
+                sx1, sy1 = max(x1, ox), max(y1, oy)
+                sx2, sy2 = min(x2, ox + size), min(y2, oy + size)
+                out[sy1 - y1:sy2 - y1, sx1 - x1:sx2 - x1] = self.chunk(cx, cy).tiles[
+                    sy1 - oy:sy2 - oy, sx1 - ox:sx2 - ox
+                ]
+        return out
+
+    def fill_rect(self, x1: int, y1: int, x2: int, y2: int, value: int) -> None:
+        size = self.chunk_size
+        for cy in range(y1 // size, (y2 - 1) // size + 1):
+            for cx in range(x1 // size, (x2 - 1) // size + 1):
+                ox, oy = cx * size, cy * size
+                self.chunk(cx, cy).fill_rect(x1 - ox, y1 - oy, x2 - ox, y2 - oy, value)
+        self.version += 1
+
+    def spawn_point(self) -> Tuple[int, int]:
+        grid = self.chunk(0, 0)
+        ys, xs = np.nonzero(grid.tiles == TILE_FLOOR)
+        # Prefer the floor tile nearest the chunk centre.
+        mid = self.chunk_size // 2
+        i = int(np.argmin((xs - mid) ** 2 + (ys - mid) ** 2))
+        return int(xs[i]), int(ys[i])
+
+    def resident(self) -> Iterator[Tuple[int, int]]:
+        return iter(self.chunks)
+
+    def _chunk_seed(self, *key: object) -> int:
+        # String seeds are hashed with SHA-512 by ``random``, so this is stable
+        # across processes regardless of PYTHONHASHSEED.
+        return random.Random(":".join(str(part) for part in (self.world_seed, *key))).getrandbits(64)
+
+    def _door(self, cx: int, cy: int, axis: str) -> int:
+        """Offset of the opening on the east (``"x"``) or south (``"y"``) edge of a chunk."""
+        rng = random.Random(self._chunk_seed("door", axis, cx, cy))
+        return rng.randint(2, self.chunk_size - 3)
+
+    def _generate(self, cx: int, cy: int) -> TileGrid:
+        size = self.chunk_size
+        seed = self._chunk_seed(cx, cy)
+        grid, rooms = generate_dungeon(seed=seed, width=size, height=size, placement="bsp")
+        rng = random.Random(seed)
+        hub = rooms[0].center() if rooms else (size // 2, size // 2)
+        # Neighbouring chunks agree on door positions, so carving from each
+        # door to a room links the chunks without generating the neighbour.
+        doors = [
+            (size - 1, self._door(cx, cy, "x")),
+            (0, self._door(cx - 1, cy, "x")),
+            (self._door(cx, cy, "y"), size - 1),
+            (self._door(cx, cy - 1, "y"), 0),
+        ]
+        for door in doors:
+            carve_hallway(grid, door, hub, rng)
+        return grid
+
+    def _spill_path(self, cx: int, cy: int) -> pathlib.Path:
+        return self.spill_dir / str(self.world_seed) / f"{cx}_{cy}.bin"
+
+    def _load(self, cx: int, cy: int) -> TileGrid | None:
+        if self.spill_dir is None:
+            return None
+        path = self._spill_path(cx, cy)
+        if not path.exists():
+            return None
+        return TileGrid.from_bytes(path.read_bytes(), self.chunk_size, self.chunk_size)
+
+    def _evict(self, key: Tuple[int, int]) -> None:
+        grid = self.chunks.pop(key)
+        generated = self._generated_version.pop(key)
+        if self.spill_dir is None or grid.version == generated:
+            return
+        path = self._spill_path(*key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(grid.to_bytes())
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import random
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import Dict, Iterator, List, Tuple
+
+import numpy as np
 
 from game import settings
 
@@ -10,6 +12,8 @@ from game import settings
 TILE_WALL = 1
 TILE_FLOOR = 0
 
+BSP_MIN_LEAF = (8, 7)
+
 
 @dataclass
 class Room:
@@ -30,17 +34,110 @@ class Room:
         )
 
 
-def carve_room(grid: List[List[int]], room: Room) -> None:
-    for x in range(room.x, room.x + room.width):
-        for y in range(room.y, room.y + room.height):
-            if 0 <= x < settings.DUNGEON_WIDTH and 0 <= y < settings.DUNGEON_HEIGHT:
-                grid[y][x] = TILE_FLOOR
+class RoomIndex:
+    """Spatial hash of rooms so overlap checks only visit nearby rooms."""
+
+    def __init__(self, cell_size: int = 8) -> None:
+        self.cell_size = cell_size
+        self.buckets: Dict[Tuple[int, int], List[Room]] = {}
+
+    def _cells(self, room: Room) -> Iterator[Tuple[int, int]]:
+        # Room.intersects treats touching edges as overlapping, hence the inclusive spans.
+        size = self.cell_size
+        for cy in range(room.y // size, (room.y + room.height) // size + 1):
+            for cx in range(room.x // size, (room.x + room.width) // size + 1):
+                yield cx, cy
+
+    def add(self, room: Room) -> None:
+        for cell in self._cells(room):
+            self.buckets.setdefault(cell, []).append(room)
+
+    def intersects(self, room: Room) -> bool:
+        for cell in self._cells(room):
+            for other in self.buckets.get(cell, ()):
+                if room.intersects(other):
+                    return True
+        return False
+
+
+class TileGrid:
+    """Dungeon tiles stored as a ``(height, width)`` uint8 NumPy array.
+
+    ``grid[y][x]``, ``len(grid)`` and row iteration still work for code written
+    against the old nested-list grids. ``version`` increases on every edit so
+    caches can tell when the tiles changed.
+    """
+
+    def __init__(self, width: int, height: int, fill: int = TILE_WALL) -> None:
+        self.tiles = np.full((height, width), fill, dtype=np.uint8)
+        self.version = 0
+
+    @classmethod
+    def from_array(cls, tiles: np.ndarray) -> "TileGrid":
+        grid = cls.__new__(cls)
+        grid.tiles = np.asarray(tiles, dtype=np.uint8)
+        grid.version = 0
+        return grid
+
+    @classmethod
+    def from_bytes(cls, data: bytes, width: int, height: int) -> "TileGrid":
+        return cls.from_array(np.frombuffer(data, dtype=np.uint8).reshape(height, width).copy())
+
+    @property
+    def width(self) -> int:
+        return self.tiles.shape[1]
+
+    @property
+    def height(self) -> int:
+        return self.tiles.shape[0]
+
+    def __len__(self) -> int:
+        return self.tiles.shape[0]
+
+    def __getitem__(self, y: int) -> np.ndarray:
+        return self.tiles[y]
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        return iter(self.tiles)
+
+    def region(self, x1: int, y1: int, x2: int, y2: int) -> np.ndarray:
+        return self.tiles[y1:y2, x1:x2]
 
+    def in_bounds(self, x: int, y: int) -> bool:
+        return 0 <= x < self.tiles.shape[1] and 0 <= y < self.tiles.shape[0]
 
-def carve_hallway(grid: List[List[int]], start: Tuple[int, int], end: Tuple[int, int]) -> None:
+    def is_walkable(self, x: int, y: int) -> bool:
+        return self.in_bounds(x, y) and bool(self.tiles[y, x] == TILE_FLOOR)
+
+    def fill_rect(self, x1: int, y1: int, x2: int, y2: int, value: int) -> None:
+        """Set every tile in ``[x1, x2) x [y1, y2)``, clipped to the grid."""
+        x1, y1 = max(0, x1), max(0, y1)
+        x2, y2 = min(self.tiles.shape[1], x2), min(self.tiles.shape[0], y2)
+        if x1 >= x2 or y1 >= y2:
+            return
+        self.tiles[y1:y2, x1:x2] = value
+        self.version += 1
+
+    def to_bytes(self) -> bytes:
+        return self.tiles.tobytes()
+
+    def tolist(self) -> List[List[int]]:
+        return self.tiles.tolist()
+
+
+def carve_room(grid: TileGrid, room: Room) -> None:
+    grid.fill_rect(room.x, room.y, room.x + room.width, room.y + room.height, TILE_FLOOR)
+
+
+def carve_hallway(
+    grid: TileGrid,
+    start: Tuple[int, int],
+    end: Tuple[int, int],
+    rng: random.Random | None = None,
+) -> None:
     x1, y1 = start
     x2, y2 = end
-    if random.random() < 0.5:
+    if (rng or random).random() < 0.5:
         carve_horizontal(grid, x1, x2, y1)
         carve_vertical(grid, y1, y2, x2)
     else:
@@ -48,35 +145,84 @@ def carve_hallway(grid: List[List[int]], start: Tuple[int, int], end: Tuple[int,
         carve_horizontal(grid, x1, x2, y2)
 
 
-def carve_horizontal(grid: List[List[int]], x1: int, x2: int, y: int) -> None:
-    for x in range(min(x1, x2), max(x1, x2) + 1):
-        if 0 <= x < settings.DUNGEON_WIDTH and 0 <= y < settings.DUNGEON_HEIGHT:
-            grid[y][x] = TILE_FLOOR
+def carve_horizontal(grid: TileGrid, x1: int, x2: int, y: int) -> None:
+    grid.fill_rect(min(x1, x2), y, max(x1, x2) + 1, y + 1, TILE_FLOOR)
 
 
-def carve_vertical(grid: List[List[int]], y1: int, y2: int, x: int) -> None:
-    for y in range(min(y1, y2), max(y1, y2) + 1):
-        if 0 <= x < settings.DUNGEON_WIDTH and 0 <= y < settings.DUNGEON_HEIGHT:
-            grid[y][x] = TILE_FLOOR
+def carve_vertical(grid: TileGrid, y1: int, y2: int, x: int) -> None:
+    grid.fill_rect(x, min(y1, y2), x + 1, max(y1, y2) + 1, TILE_FLOOR)
 
 
-def generate_dungeon(seed: int | None = None) -> Tuple[List[List[int]], List[Room]]:
+def generate_dungeon(
+    seed: int | None = None,
+    width: int = settings.DUNGEON_WIDTH,
+    height: int = settings.DUNGEON_HEIGHT,
+    room_attempts: int = 10,
+    placement: str = "scatter",
+) -> Tuple[TileGrid, List[Room]]:
+    """Carve a dungeon of rooms joined by hallways.
+
+    ``placement="scatter"`` tries ``room_attempts`` random rooms and drops the
+    ones that overlap; ``placement="bsp"`` partitions the map and puts one
+    room in each leaf, so rooms never overlap. Both are deterministic for a
+    given ``seed``.
+    """
     rng = random.Random(seed)
-    grid = [[TILE_WALL for _ in range(settings.DUNGEON_WIDTH)] for _ in range(settings.DUNGEON_HEIGHT)]
-    rooms: List[Room] = []
+    grid = TileGrid(width, height)
+    if placement == "scatter":
+        rooms = _scatter_rooms(rng, width, height, room_attempts)
+    elif placement == "bsp":
+        rooms = _bsp_rooms(rng, width, height)
+    else:
+        raise ValueError(f"Unknown room placement '{placement}'")
+
+    for i, room in enumerate(rooms):
+        carve_room(grid, room)
+        if i:
+            carve_hallway(grid, rooms[i - 1].center(), room.center(), rng)
+
+    return grid, rooms
+
 
-    for _ in range(10):
+def _scatter_rooms(rng: random.Random, width: int, height: int, attempts: int) -> List[Room]:
+    index = RoomIndex()
+    rooms: List[Room] = []
+    for _ in range(attempts):
         w = rng.randint(3, 6)
         h = rng.randint(3, 5)
-        x = rng.randint(1, settings.DUNGEON_WIDTH - w - 1)
-        y = rng.randint(1, settings.DUNGEON_HEIGHT - h - 1)
+        x = rng.randint(1, width - w - 1)
+        y = rng.randint(1, height - h - 1)
         new_room = Room(x, y, w, h)
-        if any(new_room.intersects(other) for other in rooms):
+        if index.intersects(new_room):
             continue
-        carve_room(grid, new_room)
-        if rooms:
-            prev_center = rooms[-1].center()
-            carve_hallway(grid, prev_center, new_room.center())
+        index.add(new_room)
         rooms.append(new_room)
+    return rooms
 
-    return grid, rooms
+
+def _bsp_rooms(rng: random.Random, width: int, height: int) -> List[Room]:
+    min_w, min_h = BSP_MIN_LEAF
+    rooms: List[Room] = []
+    stack = [(1, 1, width - 2, height - 2)]
+    while stack:
+        x, y, w, h = stack.pop()
+        can_split_x = w >= min_w * 2
+        can_split_y = h >= min_h * 2
+        if can_split_x and (not can_split_y or w >= h):
+            cut = rng.randint(min_w, w - min_w)
+            # Push the second half first so leaves come out left-to-right.
+            stack.append((x + cut, y, w - cut, h))
+            stack.append((x, y, cut, h))
+        elif can_split_y:
+            cut = rng.randint(min_h, h - min_h)
+            stack.append((x, y + cut, w, h - cut))
+            stack.append((x, y, w, cut))
+        elif w >= 4 and h >= 4:
+            # Leave the last column and row of the leaf empty so neighbouring
+            # rooms never touch.
+            room_w = rng.randint(3, min(6, w - 1))
+            room_h = rng.randint(3, min(5, h - 1))
+            room_x = rng.randint(x, x + w - room_w - 1)
+            room_y = rng.randint(y, y + h - room_h - 1)
+            rooms.append(Room(room_x, room_y, room_w, room_h))
+    return rooms
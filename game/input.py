@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import random
+from collections import deque
+from typing import TYPE_CHECKING, Deque, Iterable, List, Sequence, Set, Tuple
+
+import pygame
+
+if TYPE_CHECKING:
+    from main import GameApp
+
+ScriptedEvent = Tuple[int, pygame.event.Event]
+
+
+class KeyState:
+    """Pressed-key snapshot indexable like ``pygame.key.get_pressed()``."""
+
+    def __init__(self, pressed: Set[int]) -> None:
+        self._pressed = frozenset(pressed)
+
+    def __getitem__(self, key: int) -> bool:
+        return key in self._pressed
+
+
+class PygameInput:
+    """Live keyboard and mouse input from the SDL event queue."""
+
+    def poll(self, tick: int) -> List[pygame.event.Event]:
+        return pygame.event.get()
+
+    def pressed(self):
+        return pygame.key.get_pressed()
+
+
+class ScriptedInput:
+    """Replays ``(tick, event)`` pairs instead of reading the event queue.
+
+    Held keys are tracked from the scripted ``KEYDOWN``/``KEYUP`` events, so
+    :meth:`pressed` drives continuous movement the same way a real keyboard
+    would. With ``quit_when_done`` a ``QUIT`` event follows the last entry.
+    """
+
+    def __init__(self, script: Iterable[ScriptedEvent], quit_when_done: bool = False) -> None:
+        self.script: Deque[ScriptedEvent] = deque(sorted(script, key=lambda item: item[0]))
+        self.quit_when_done = quit_when_done
+        self._down: Set[int] = set()
+
+    @property
+    def done(self) -> bool:
+        return not self.script
+
+    def poll(self, tick: int) -> List[pygame.event.Event]:
+        events = []
+        while self.script and self.script[0][0] <= tick:
+            events.append(self.script.popleft()[1])
+        if not self.script and self.quit_when_done:
+            events.append(pygame.event.Event(pygame.QUIT))
+            self.quit_when_done = False
+        self._track(events)
+        return events
+
+    def pressed(self) -> KeyState:
+        return KeyState(self._down)
+
+    def _track(self, events: Sequence[pygame.event.Event]) -> None:
+        for event in events:
+            if event.type == pygame.KEYDOWN:
+                self._down.add(event.key)
+            elif event.type == pygame.KEYUP:
+                self._down.discard(event.key)
+
+
+def key_tap(tick: int, key: int, hold: int = 1) -> List[ScriptedEvent]:
+    """Script entries pressing ``key`` at ``tick`` and releasing it ``hold`` ticks later."""
+    return [
+        (tick, pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode="", scancode=0)),
+        (tick + hold, pygame.event.Event(pygame.KEYUP, key=key, mod=0, unicode="", scancode=0)),
+    ]
+
+
+class RandomInput(ScriptedInput):
+    """Soak-test bot that mashes game keys from a seeded RNG.
+
+    It never confirms the main menu's Exit entry, so a soak run only ends when
+    the caller stops it.
+    """
+
+    KEYS = (
+        pygame.K_w, pygame.K_a, pygame.K_s, pygame.K_d,
+        pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT,
+        pygame.K_RETURN, pygame.K_SPACE, pygame.K_ESCAPE, pygame.K_r,
+    )
+
+    def __init__(self, app: "GameApp", seed: int | None = None, mean_gap: int = 20) -> None:
+        super().__init__(())
+        self.app = app
+        self.rng = random.Random(seed)
+        self.mean_gap = mean_gap
+        self._next_tick = 0
+
+    def poll(self, tick: int) -> List[pygame.event.Event]:
+        while self._next_tick <= tick:
+            key = self.rng.choice(self.KEYS)
+            if not self._would_quit(key):
+                self.script.extend(key_tap(self._next_tick, key, self.rng.randint(1, self.mean_gap)))
+            self._next_tick += self.rng.randint(1, self.mean_gap * 2)
+        self.script = deque(sorted(self.script, key=lambda item: item[0]))
+        return super().poll(tick)
+
+    def _would_quit(self, key: int) -> bool:
+        if key not in (pygame.K_RETURN, pygame.K_SPACE):
+            return False
+        machine = self.app.state_machine
+        if machine.current_name != "menu":
+            return False
+        state = machine.current
+        return state.options[state.index].callback == state.quit_game
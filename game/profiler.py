@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import csv
+import json
+from collections import deque
+from time import perf_counter
+from typing import IO, Deque, Dict, List, Tuple
+
+from game import settings
+
+PHASES = ("event", "update", "draw", "flip")
+PERCENTILES = (50, 95, 99)
+COLUMNS = ("frame", "state", *(f"{phase}_ms" for phase in PHASES), "total_ms")
+
+# frame number, state name, then milliseconds per phase and for the whole frame
+FrameRecord = Tuple[int, str, float, float, float, float, float]
+
+
+class FrameProfiler:
+    """Per-state frame timings with rolling percentiles.
+
+    :class:`StateMachine` reports how long each state spent handling events,
+    updating and drawing, and ``GameApp.run`` reports ``display.flip``. Every
+    phase keeps its last ``window`` samples per state for percentiles, and
+    the last ``history`` whole frames are kept for graphs and export. To
+    capture a whole session, however long, :meth:`stream_to` a file instead.
+    """
+
+    def __init__(self, window: int = settings.PROFILER_WINDOW, history: int = settings.PROFILER_HISTORY) -> None:
+        self.window = window
+        self.samples: Dict[Tuple[str, str], Deque[float]] = {}
+        self.frames: Deque[FrameRecord] = deque(maxlen=history)
+        self.frame_count = 0
+        self._phase_ms = dict.fromkeys(PHASES, 0.0)
+        self._frame_start = perf_counter()
+        self._stream: _FrameWriter | None = None
+
+    def begin_frame(self) -> None:
+        for phase in PHASES:
+            self._phase_ms[phase] = 0.0
+        self._frame_start = perf_counter()
+
+    def record(self, state: str, phase: str, seconds: float) -> None:
+        ms = seconds * 1000
+        self._phase_ms[phase] += ms
+        self._window(state, phase).append(ms)
+
+    def end_frame(self, state: str) -> None:
+        total = (perf_counter() - self._frame_start) * 1000
+        self._window(state, "frame").append(total)
+        phases = self._phase_ms
+        frame = (self.frame_count, state, phases["event"], phases["update"], phases["draw"], phases["flip"], total)
+        self.frames.append(frame)
+        if self._stream is not None:
+            self._stream.write(frame)
+        self.frame_count += 1
+
+    def percentiles(self, state: str, phase: str = "frame") -> Dict[int, float]:
+        """Nearest-rank p50/p95/p99 over the rolling window, in milliseconds."""
+        values = sorted(self.samples.get((state, phase), ()))
+        if not values:
+            return {p: 0.0 for p in PERCENTILES}
+        return {p: values[min(len(values) - 1, len(values) * p // 100)] for p in PERCENTILES}
+
+    def summary(self) -> Dict[str, Dict[str, Dict[int, float]]]:
+        report: Dict[str, Dict[str, Dict[int, float]]] = {}
+        for state, phase in self.samples:
+            report.setdefault(state, {})[phase] = self.percentiles(state, phase)
+        return report
+
+    def recent(self, count: int) -> List[float]:
+        """Total milliseconds of the newest ``count`` frames, oldest first."""
+        start = max(0, len(self.frames) - count)
+        return [self.frames[i][-1] for i in range(start, len(self.frames))]
+
+    def export(self, path: str) -> None:
+        """Write the kept ``history`` to ``path``: JSON if it ends in ``.json``, else CSV."""
+        writer = _FrameWriter(path)
+        for frame in self.frames:
+            writer.write(frame)
+        writer.close(self.summary())
+
+    def stream_to(self, path: str) -> None:
+        """Write every frame from now on to ``path``, in :meth:`export`'s formats.
+
+        Frames go straight to the file, so nothing is dropped however long the
+        session runs. :meth:`close` finishes the file.
+        """
+        self.close()
+        self._stream = _FrameWriter(path)
+
+    def close(self) -> None:
+        if self._stream is not None:
+            self._stream.close(self.summary())
+            self._stream = None
+
+    def _window(self, state: str, phase: str) -> Deque[float]:
+        samples = self.samples.get((state, phase))
+        if samples is None:
+            samples = self.samples[(state, phase)] = deque(maxlen=self.window)
+        return samples
+
+
+class _FrameWriter:
+    """Writes frame records to a CSV file, or a JSON one ending with the summary."""
+
+    def __init__(self, path: str) -> None:
+        self.handle: IO[str] = open(path, "w", newline="", encoding="utf-8")
+        self.json = path.endswith(".json")
+        self.count = 0
+        if self.json:
+            self.handle.write('{"frames": [')
+        else:
+            self.csv = csv.writer(self.handle)
+            self.csv.writerow(COLUMNS)
+
+    def write(self, frame: FrameRecord) -> None:
+        if self.json:
+            self.handle.write(("\n" if not self.count else ",\n") + json.dumps(dict(zip(COLUMNS, frame))))
+        else:
+            self.csv.writerow(frame)
+        self.count += 1
+
+    def close(self, summary: dict) -> None:
+        if self.json:
+            self.handle.write(f'\n], "summary": {json.dumps(summary)}}}\n')
+        self.handle.close()
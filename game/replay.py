@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import struct
+import zlib
+from dataclasses import dataclass, field
+from typing import List
+
+import pygame
+
+from game.input import PygameInput, ScriptedEvent, ScriptedInput
+
+MAGIC = b"TDRP"
+VERSION = 1
+
+# magic, version, run seed, ticks played, event count
+HEADER = struct.Struct("<4sHQII")
+# tick, event kind, key or mouse button, x, y
+RECORD = struct.Struct("<IBIhh")
+
+# Only events the simulation reacts to are recorded; mouse motion and window
+# events only affect drawing.
+EVENT_KINDS = (pygame.KEYDOWN, pygame.KEYUP, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.QUIT)
+KEY_EVENTS = (pygame.KEYDOWN, pygame.KEYUP)
+MOUSE_EVENTS = (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP)
+
+
+@dataclass
+class Replay:
+    """A recorded run: the seed for ``GameApp.rng`` and the input it received."""
+
+    seed: int
+    ticks: int = 0
+    events: List[ScriptedEvent] = field(default_factory=list)
+
+    def input(self) -> ScriptedInput:
+        return ScriptedInput(self.events)
+
+    def save(self, path: str) -> None:
+        body = b"".join(_pack(tick, event) for tick, event in self.events)
+        with open(path, "wb") as handle:
+            handle.write(HEADER.pack(MAGIC, VERSION, self.seed, self.ticks, len(self.events)))
+            handle.write(zlib.compress(body, 9))
+
+    @classmethod
+    def load(cls, path: str) -> "Replay":
+        with open(path, "rb") as handle:
+            data = handle.read()
+        magic, version, seed, ticks, count = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a replay file")
+        if version != VERSION:
+            raise ValueError(f"Unsupported replay version {version}")
+        body = zlib.decompress(data[HEADER.size:])
+        events = [_unpack(*RECORD.unpack_from(body, i * RECORD.size)) for i in range(count)]
+        return cls(seed, ticks, events)
+
+
+class InputRecorder:
+    """Wraps an input source and records what it delivers, tick by tick."""
+
+    def __init__(self, seed: int, source=None) -> None:
+        self.source = source or PygameInput()
+        self.replay = Replay(seed)
+
+    def poll(self, tick: int) -> List[pygame.event.Event]:
+        events = self.source.poll(tick)
+        self.replay.events.extend((tick, event) for event in events if event.type in EVENT_KINDS)
+        return events
+
+    def pressed(self):
+        return self.source.pressed()
+
+    def save(self, path: str, ticks: int) -> None:
+        self.replay.ticks = ticks
+        self.replay.save(path)
+
+
+def _pack(tick: int, event: pygame.event.Event) -> bytes:
+    if event.type in KEY_EVENTS:
+        return RECORD.pack(tick, EVENT_KINDS.index(event.type), event.key, 0, 0)
+    if event.type in MOUSE_EVENTS:
+        return RECORD.pack(tick, EVENT_KINDS.index(event.type), event.button, *event.pos)
+    return RECORD.pack(tick, EVENT_KINDS.index(event.type), 0, 0, 0)
+
+
+def _unpack(tick: int, kind: int, code: int, x: int, y: int) -> ScriptedEvent:
+    event_type = EVENT_KINDS[kind]
+    if event_type in KEY_EVENTS:
+        return tick, pygame.event.Event(event_type, key=code, mod=0, unicode="", scancode=0)
+    if event_type in MOUSE_EVENTS:
+        return tick, pygame.event.Event(event_type, button=code, pos=(x, y))
+    return tick, pygame.event.Event(event_type)
@@ -3,6 +3,10 @@ import pygame
 WINDOW_WIDTH = 1280
 WINDOW_HEIGHT = 720
 FPS = 60
+SIM_HZ = 60
+MAX_CATCHUP_STEPS = 5
+PROFILER_WINDOW = 240
+PROFILER_HISTORY = 36000
 TITLE = "Exiles of Aether"
 
 BLACK = pygame.Color(10, 10, 16)
@@ -12,6 +16,8 @@ ACCENT = pygame.Color(142, 207, 201)
 ERROR = pygame.Color(207, 102, 121)
 
 FONT_PATH = None
+TEXT_CACHE_BYTES = 8 * 1024 * 1024
+TEXT_LAYOUT_CACHE_SIZE = 1024
 
 PARTY_SIZE = 3
 
@@ -19,9 +25,26 @@ GRID_SIZE = 64
 DUNGEON_WIDTH = 20
 DUNGEON_HEIGHT = 12
 
+STREAM_CHUNK_TILES = 32
+STREAM_MAX_CHUNKS = 256
+
+RENDER_CHUNK_TILES = 8
+RENDER_CACHE_BYTES = 32 * 1024 * 1024
+
 CAMERA_MARGIN = 120
 
+PLAYER_SPEED = 4
+
+FOV_RADIUS = 8
+FLOW_FIELD_RADIUS = 32
+PURSUER_SPEED = 2.5
+
+COMBAT_LOG_CAPACITY = 256
+
 SAVE_DIR = "saves"
+AUTOSAVE_FILE = "autosave.sav"
+AUTOSAVE_SECONDS = 60
+FLOOR_ARCHIVE_FILE = "floors.bin"
 ASSET_DIR = "assets"
 
 MUSIC_VOLUME = 0.4
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
-from typing import Dict, Optional, Type
+import importlib
+from time import perf_counter
+from typing import Callable, Dict, List, Optional, Tuple
 
 import pygame
 
+from game.profiler import FrameProfiler
+
 
 class GameState:
     """Base class for application states.
@@ -31,37 +35,102 @@ class GameState:
         pass
 
 
+StateFactory = Callable[["GameApp"], GameState]
+
+
+class LazyState:
+    """State factory that imports ``module`` only when the state is first built."""
+
+    def __init__(self, module: str, class_name: str) -> None:
+        self.module = module
+        self.class_name = class_name
+        self.import_seconds = 0.0
+
+    def __call__(self, app: "GameApp") -> GameState:
+        start = perf_counter()
+        state_cls = getattr(importlib.import_module(self.module), self.class_name)
+        self.import_seconds = perf_counter() - start
+        return state_cls(app)
+
+
 class StateMachine:
-    """Orchestrates state transitions and lifecycle management."""
+    """Orchestrates state transitions and lifecycle management.
+
+    States are registered as factories (a state class works as one) and built
+    on first use, so startup only pays for the states it actually shows.
+    """
 
     def __init__(self, app: "GameApp") -> None:
         self.app = app
+        self.factories: Dict[str, StateFactory] = {}
         self.states: Dict[str, GameState] = {}
+        self.build_times: Dict[str, Tuple[float, float]] = {}
         self.current: Optional[GameState] = None
         self.current_name: Optional[str] = None
+        self.profiler: Optional[FrameProfiler] = None
 
-    def register(self, name: str, state_cls: Type[GameState]) -> None:
-        if name in self.states:
+    def register(self, name: str, factory: StateFactory) -> None:
+        if name in self.factories:
             raise ValueError(f"State '{name}' already registered")
-        self.states[name] = state_cls(self.app)
+        self.factories[name] = factory
+
+    def get(self, name: str) -> GameState:
+        """Return the state called ``name``, building it if needed."""
+        state = self.states.get(name)
+        if state is not None:
+            return state
+        if name not in self.factories:
+            raise KeyError(f"State '{name}' not registered")
+        factory = self.factories[name]
+        start = perf_counter()
+        state = self.states[name] = factory(self.app)
+        total = perf_counter() - start
+        imported = getattr(factory, "import_seconds", 0.0)
+        self.build_times[name] = (imported, total - imported)
+        return state
+
+    def pending(self) -> List[str]:
+        return [name for name in self.factories if name not in self.states]
+
+    def preload_next(self) -> bool:
+        """Build one state that hasn't been used yet; ``False`` once all are built.
+
+        Called between frames, this warms the remaining states without a
+        single long stall.
+        """
+        for name in self.factories:
+            if name not in self.states:
+                self.get(name)
+                return True
+        return False
 
     def switch(self, name: str, **params) -> None:
-        if name not in self.states:
-            raise KeyError(f"State '{name}' not registered")
+        state = self.get(name)
         if self.current:
             self.current.exit()
         self.current_name = name
-        self.current = self.states[name]
+        self.current = state
         self.current.enter(**params)
 
     def handle_event(self, event: pygame.event.Event) -> None:
         if self.current:
-            self.current.handle_event(event)
+            self._timed("event", self.current.handle_event, event)
 
     def update(self, dt: float) -> None:
         if self.current:
-            self.current.update(dt)
+            self._timed("update", self.current.update, dt)
 
     def draw(self, surface: pygame.Surface) -> None:
         if self.current:
-            self.current.draw(surface)
+            self._timed("draw", self.current.draw, surface)
+
+    def _timed(self, phase: str, hook, arg) -> None:
+        if self.profiler is None:
+            hook(arg)
+            return
+        # Charge the time to the state that was current when the hook began,
+        # even if the hook switches states.
+        name = self.current_name
+        start = perf_counter()
+        hook(arg)
+        self.profiler.record(name, phase, perf_counter() - start)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import os
+
 import pygame
 
 from game import settings
@@ -8,6 +10,7 @@ from game.core.inventory import Inventory
 from game.data.quests import QUESTS
 from game.state_machine import GameState
 from game.states.base import BaseMenuState, MenuOption
+from game.ui.text import render_text
 
 
 class MainMenuState(BaseMenuState, GameState):
@@ -16,17 +19,39 @@ class MainMenuState(BaseMenuState, GameState):
         BaseMenuState.__init__(self, app)
         self.title = "Exiles of Aether"
         self.subtitle = "Top-down rogue-lite expedition into the Shattered Vaults"
-        self.background = pygame.Surface((settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT))
-        self.background.fill((14, 20, 30))
+        self.background = app.assets.surface(
+            "menu_background", (settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT), (14, 20, 30)
+        )
+        self.toast_text = ""
+        self.toast_timer = 0.0
+        self._init_options()
+
+    def enter(self, **params) -> None:
+        # Rebuilt on every visit so "Resume" appears once an autosave exists.
         self._init_options()
+        super().enter(**params)
 
     def _init_options(self) -> None:
-        self.options = [
+        self.options = []
+        if self.app.resumable and os.path.exists(self.app.autosaver.path):
+            self.options.append(
+                MenuOption(
+                    "Resume Expedition",
+                    self.resume,
+                    "Pick up the last autosaved run where the squad left off.",
+                )
+            )
+        self.options += [
             MenuOption(
                 "Begin Expedition",
                 self.start_new_game,
                 "Forge a new squad of three exiles and descend into procedural vaults.",
             ),
+            MenuOption(
+                "Endless Descent",
+                lambda: self.start_new_game(endless=True),
+                "Wander an unbounded vault that unfolds around the squad as it explores.",
+            ),
             MenuOption(
                 "Party Configurator",
                 lambda: self.app.state_machine.switch("party"),
@@ -45,14 +70,25 @@ class MainMenuState(BaseMenuState, GameState):
             MenuOption("Exit", self.quit_game),
         ]
 
-    def start_new_game(self) -> None:
+    def start_new_game(self, endless: bool = False) -> None:
         if not self.app.player_party:
-            self.app.player_party = generate_party()
+            self.app.player_party = generate_party(rng=self.app.rng.stream("party"))
             inventory = Inventory()
             inventory.gold = self.app.gold
             inventory.add_item("Wayfarer Rations", 3)
             self.app.inventory = inventory.items
-        self.app.state_machine.switch("world", new_run=True)
+        self.app.state_machine.switch("world", new_run=True, endless=endless)
+
+    def resume(self) -> None:
+        try:
+            self.app.load_game()
+        except (OSError, ValueError) as exc:
+            self.toast_text = f"Could not resume: {exc}"
+            self.toast_timer = 3.0
+
+    def update(self, dt: float) -> None:
+        if self.toast_timer > 0:
+            self.toast_timer -= dt
 
     def view_codex(self) -> None:
         lines = []
@@ -66,3 +102,6 @@ class MainMenuState(BaseMenuState, GameState):
     def draw(self, surface: pygame.Surface) -> None:
         surface.blit(self.background, (0, 0))
         super().draw(surface)
+        if self.toast_timer > 0:
+            text = render_text(self.small_font, self.toast_text, True, settings.ERROR)
+            surface.blit(text, text.get_rect(midbottom=(settings.WINDOW_WIDTH // 2, settings.WINDOW_HEIGHT - 20)))
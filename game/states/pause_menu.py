@@ -13,8 +13,9 @@ class PauseMenuState(BaseMenuState, GameState):
         BaseMenuState.__init__(self, app)
         self.title = "Expedition Paused"
         self.subtitle = "Manage your squad mid-run"
-        self.overlay = pygame.Surface((settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT), pygame.SRCALPHA)
-        self.overlay.fill((0, 0, 0, 160))
+        self.overlay = app.assets.surface(
+            "pause_overlay", (settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT), (0, 0, 0, 160), alpha=True
+        )
         self.options = [
             MenuOption(
                 "Resume",
@@ -41,6 +42,6 @@ class PauseMenuState(BaseMenuState, GameState):
         self.app.state_machine.switch("menu")
 
     def draw(self, surface: pygame.Surface) -> None:
-        self.app.state_machine.states["world"].draw(surface)
+        self.app.state_machine.get("world").draw(surface)
         surface.blit(self.overlay, (0, 0))
         super().draw(surface)
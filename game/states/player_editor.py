@@ -5,13 +5,14 @@ import pygame
 from game import settings
 from game.data.items import ITEMS
 from game.state_machine import GameState
+from game.ui.text import render_text
 
 
 class PlayerEditorState(GameState):
     def __init__(self, app: "GameApp") -> None:
         super().__init__(app)
-        self.font = pygame.font.Font(settings.FONT_PATH, 26)
-        self.small_font = pygame.font.Font(settings.FONT_PATH, 20)
+        self.font = app.assets.font(26)
+        self.small_font = app.assets.font(20)
         self.index = 0
         self.selected_slot = "Weapon"
         self.slots = ["Weapon", "Shield", "Accessory"]
@@ -36,17 +37,17 @@ class PlayerEditorState(GameState):
     def draw(self, surface: pygame.Surface) -> None:
         surface.fill((16, 20, 28))
         if not self.app.player_party:
-            text = self.font.render("No party members configured", True, settings.ERROR)
+            text = render_text(self.font, "No party members configured", True, settings.ERROR)
             surface.blit(text, text.get_rect(center=(settings.WINDOW_WIDTH // 2, settings.WINDOW_HEIGHT // 2)))
             return
         member = self.app.player_party[self.index]
-        title = self.font.render(f"{member.codename} - {member.archetype.name}", True, settings.WHITE)
+        title = render_text(self.font, f"{member.codename} - {member.archetype.name}", True, settings.WHITE)
         surface.blit(title, (80, 60))
         stats = [f"HP {member.max_hp}", f"Mana {member.max_mana}"] + [
             f"{key.title()}: {value}" for key, value in member.stats.items() if key not in {"hp", "mana"}
         ]
         for i, stat in enumerate(stats):
-            surf = self.small_font.render(stat, True, settings.LIGHT_GREY)
+            surf = render_text(self.small_font, stat, True, settings.LIGHT_GREY)
             surface.blit(surf, (80, 120 + i * 28))
 
         for i, slot in enumerate(self.slots):
@@ -55,7 +56,7 @@ class PlayerEditorState(GameState):
             border_color = settings.ACCENT if slot == self.selected_slot else settings.LIGHT_GREY
             pygame.draw.rect(surface, border_color, rect, 2)
             equipped = member.equipped.get(slot.lower(), "Empty")
-            surf = self.small_font.render(f"{slot}: {equipped}", True, settings.WHITE)
+            surf = render_text(self.small_font, f"{slot}: {equipped}", True, settings.WHITE)
             surface.blit(surf, (rect.x + 16, rect.y + 24))
 
     def cycle_equipment(self) -> None:
@@ -66,5 +67,4 @@ class PlayerEditorState(GameState):
         if not candidates:
             return
         selection = candidates[0]
-        member.equipped[self.selected_slot.lower()] = selection
-        member.recalculate_stats()
+        member.equip(self.selected_slot.lower(), selection)
@@ -5,13 +5,14 @@ import pygame
 from game import settings
 from game.data.items import ITEMS, SHOP_STOCK
 from game.state_machine import GameState
+from game.ui.text import render_text
 
 
 class ShopState(GameState):
     def __init__(self, app: "GameApp") -> None:
         super().__init__(app)
-        self.font = pygame.font.Font(settings.FONT_PATH, 26)
-        self.small_font = pygame.font.Font(settings.FONT_PATH, 20)
+        self.font = app.assets.font(26)
+        self.small_font = app.assets.font(20)
         self.stalls = list(SHOP_STOCK.keys())
         self.index = 0
         self.message = ""
@@ -34,16 +35,16 @@ class ShopState(GameState):
 
     def draw(self, surface: pygame.Surface) -> None:
         surface.fill((12, 18, 24))
-        title = self.font.render("Vault Caravan", True, settings.WHITE)
+        title = render_text(self.font, "Vault Caravan", True, settings.WHITE)
         surface.blit(title, (80, 50))
-        gold_text = self.small_font.render(f"Gold: {self.app.gold}", True, settings.ACCENT)
+        gold_text = render_text(self.small_font, f"Gold: {self.app.gold}", True, settings.ACCENT)
         surface.blit(gold_text, (80, 100))
         for i, stall in enumerate(self.stalls):
             rect = pygame.Rect(80 + i * 360, 160, 320, 420)
             pygame.draw.rect(surface, (24, 28, 36), rect, border_radius=10)
             border = settings.ACCENT if i == self.index else settings.LIGHT_GREY
             pygame.draw.rect(surface, border, rect, 2)
-            stall_text = self.font.render(stall, True, settings.WHITE)
+            stall_text = render_text(self.font, stall, True, settings.WHITE)
             surface.blit(stall_text, (rect.x + 18, rect.y + 18))
             for j, item_name in enumerate(SHOP_STOCK[stall]):
                 item = ITEMS[item_name]
@@ -51,17 +52,17 @@ class ShopState(GameState):
                 item_rect = pygame.Rect(rect.x + 12, y, rect.width - 24, 100)
                 pygame.draw.rect(surface, (30, 36, 46), item_rect, border_radius=8)
                 pygame.draw.rect(surface, settings.LIGHT_GREY, item_rect, 1)
-                name = self.small_font.render(item.name, True, settings.WHITE)
+                name = render_text(self.small_font, item.name, True, settings.WHITE)
                 surface.blit(name, (item_rect.x + 12, item_rect.y + 10))
-                desc = self.small_font.render(item.description[:30] + "...", True, settings.LIGHT_GREY)
+                desc = render_text(self.small_font, item.description[:30] + "...", True, settings.LIGHT_GREY)
                 surface.blit(desc, (item_rect.x + 12, item_rect.y + 40))
-                price = self.small_font.render(f"{item.value}g", True, settings.ACCENT)
+                price = render_text(self.small_font, f"{item.value}g", True, settings.ACCENT)
                 surface.blit(price, (item_rect.x + 12, item_rect.y + 70))
         hint = "ENTER buy | S sell first owned item"
-        hint_surf = self.small_font.render(hint, True, settings.LIGHT_GREY)
+        hint_surf = render_text(self.small_font, hint, True, settings.LIGHT_GREY)
         surface.blit(hint_surf, (80, 620))
         if self.message:
-            msg = self.small_font.render(self.message, True, settings.WHITE)
+            msg = render_text(self.small_font, self.message, True, settings.WHITE)
             surface.blit(msg, (80, 650))
 
     def buy_first_item(self) -> None:
@@ -1,42 +1,155 @@
 from __future__ import annotations
 
-import random
-from typing import List
+import math
+import os
+from typing import List, Tuple
 
+import numpy as np
 import pygame
 
 from game import settings
-from game.core.combat import CombatSimulator
+from game.core.combat import CombatLog, CombatSimulator
 from game.core.entities import instantiate_enemy
+from game.core.floors import FloorArchive
+from game.core.fov import FieldOfView
+from game.core.navigation import FlowField
+from game.core.save import WORLD_STREAMING, WorldRecord
+from game.core.streaming import StreamingWorld
 from game.data.enemies import ENEMIES
-from game.core.world import TILE_FLOOR, generate_dungeon
+from game.core.world import Room, TileGrid, generate_dungeon
 from game.state_machine import GameState
-from game.ui.components import GridRenderer
+from game.ui.components import FogOverlay, GridRenderer
+from game.ui.text import render_text
 
 
 class WorldState(GameState):
     def __init__(self, app: "GameApp") -> None:
         super().__init__(app)
-        self.grid: List[List[int]] = []
+        self.grid: TileGrid | StreamingWorld | None = None
         self.rooms = []
         self.renderer = GridRenderer(tile_size=48)
         self.camera = pygame.Rect(0, 0, settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT)
         self.player_pos = pygame.Vector2(3, 3)
+        self.prev_player_pos = pygame.Vector2(self.player_pos)
+        self.player_chunk: Tuple[int, int] | None = None
+        self.flow_field: FlowField | None = None
+        self.pursuers: List[pygame.Vector2] = []
+        self.prev_pursuers: List[pygame.Vector2] = []
+        self.fov: FieldOfView | None = None
+        self.floors: FloorArchive | None = None
+        self.floor = 0
+        self.floor_seed = 0
+        self.fog: FogOverlay | None = None
         self.party_health: List[int] = []
         self.toast_timer = 0.0
         self.toast_text = ""
-        self.font = pygame.font.Font(settings.FONT_PATH, 24)
-        self.log: List[str] = []
+        self.autosave_timer = 0.0
+        self.font = app.assets.font(24)
+        self.log = CombatLog(history_path=os.path.join(app.save_dir, "combat_history.log"))
 
     def enter(self, **params) -> None:
         new_run = params.get("new_run", False)
-        if new_run or not self.grid:
-            self.grid, self.rooms = generate_dungeon()
-            self.player_pos.update(3, 3)
+        if new_run or self.grid is None:
+            if params.get("endless", False):
+                grid = StreamingWorld(
+                    self.app.rng.stream("world").getrandbits(32),
+                    spill_dir=os.path.join(self.app.save_dir, "stream"),
+                )
+                self.set_archive(None)
+                self.begin(grid, [], grid.spawn_point())
+            else:
+                self.set_archive(FloorArchive(self.floor_archive_path(), reset=True))
+                self.go_to_floor(0)
             self.toast("Entering the Shattered Vaults")
-            self.party_health = [member.max_hp for member in self.app.player_party]
-        if params.get("combat_log"):
-            self.log = params["combat_log"]
+        for line in params.get("combat_log", ()):
+            self.log.append(line)
+
+    def begin(
+        self,
+        grid: TileGrid | StreamingWorld,
+        rooms: List[Room],
+        player_pos: Tuple[float, float],
+        pursuers: List[Tuple[float, float]] | None = None,
+        explored: np.ndarray | None = None,
+    ) -> None:
+        """Start play on ``grid``; pursuers default to one per room after the first."""
+        self.grid = grid
+        self.rooms = rooms
+        self.player_pos.update(player_pos)
+        if isinstance(grid, StreamingWorld):
+            self.fov = None
+            self.fog = None
+        else:
+            self.fov = FieldOfView(grid, explored=explored)
+            self.fog = FogOverlay(self.fov, self.renderer.tile_size)
+            if explored is not None:
+                self.fog.patch((0, 0, grid.width, grid.height))
+        self.player_chunk = None
+        self.flow_field = FlowField(grid)
+        if pursuers is None:
+            pursuers = [room.center() for room in rooms[1:]]
+        self.pursuers = [pygame.Vector2(pos) for pos in pursuers]
+        self.snapshot_positions()
+        self.party_health = [member.max_hp for member in self.app.player_party]
+        self.autosave_timer = 0.0
+
+    def restore(self, world: WorldRecord) -> None:
+        if world.kind == WORLD_STREAMING:
+            self.set_archive(None)
+            grid = StreamingWorld(world.world_seed, spill_dir=os.path.join(self.app.save_dir, "stream"))
+            self.begin(grid, world.rooms, world.player_pos, world.pursuers)
+        else:
+            try:
+                archive = FloorArchive(self.floor_archive_path())
+            except (OSError, ValueError):
+                archive = None
+            floor = archive.load(world.floor) if archive is not None and world.floor < len(archive) else None
+            if (
+                floor is not None
+                and floor.seed == world.floor_seed
+                and floor.grid.tiles.shape == (world.height, world.width)
+            ):
+                # Same run: the archive is written through as the floor
+                # changes, so it also carries explored state.
+                self.set_archive(archive)
+                self.floor, self.floor_seed = world.floor, world.floor_seed
+                self.begin(floor.grid, floor.rooms, world.player_pos, world.pursuers, floor.explored)
+            else:
+                # The archive is damaged, belongs to another run or predates
+                # seeded saves. Its floors are not ours, so start a fresh
+                # archive whose first floor is the saved one.
+                if archive is not None:
+                    archive.close()
+                self.set_archive(FloorArchive(self.floor_archive_path(), reset=True))
+                grid = TileGrid.from_bytes(world.tiles, world.width, world.height)
+                self.floor = self.floors.append(grid, world.rooms, world.floor_seed)
+                self.floor_seed = world.floor_seed
+                floor = self.floors.load(self.floor)
+                self.begin(floor.grid, floor.rooms, world.player_pos, world.pursuers, floor.explored)
+        self.toast("Expedition resumed")
+
+    def set_archive(self, archive: FloorArchive | None) -> None:
+        if self.floors is not None and self.floors is not archive:
+            self.floors.close()
+        self.floors = archive
+
+    def close(self) -> None:
+        """Flush and release files held by the run; called on exit."""
+        self.set_archive(None)
+        self.log.close()
+
+    def floor_archive_path(self) -> str:
+        return os.path.join(self.app.save_dir, settings.FLOOR_ARCHIVE_FILE)
+
+    def go_to_floor(self, index: int) -> None:
+        """Switch to floor ``index``, generating and archiving it on the first visit."""
+        if index >= len(self.floors):
+            seed = self.app.rng.stream("world").getrandbits(32)
+            grid, rooms = generate_dungeon(seed)
+            index = self.floors.append(grid, rooms, seed)
+        floor = self.floors.load(index)
+        self.floor, self.floor_seed = index, floor.seed
+        self.begin(floor.grid, floor.rooms, (3, 3), explored=floor.explored)
 
     def toast(self, text: str, duration: float = 2.5) -> None:
         self.toast_text = text
@@ -48,11 +161,18 @@ class WorldState(GameState):
                 self.app.state_machine.switch("pause")
             elif event.key == pygame.K_SPACE:
                 self.initiate_combat()
+            elif self.floors is not None and event.key == pygame.K_PAGEDOWN:
+                self.go_to_floor(self.floor + 1)
+                self.toast(f"Descending to floor {self.floor + 1}")
+            elif self.floors is not None and event.key == pygame.K_PAGEUP and self.floor > 0:
+                self.go_to_floor(self.floor - 1)
+                self.toast(f"Climbing to floor {self.floor + 1}")
         elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             self.initiate_combat()
 
     def update(self, dt: float) -> None:
-        keys = pygame.key.get_pressed()
+        self.snapshot_positions()
+        keys = self.app.input.pressed()
         move = pygame.Vector2(0, 0)
         if keys[pygame.K_w] or keys[pygame.K_UP]:
             move.y -= 1
@@ -63,30 +183,38 @@ class WorldState(GameState):
         if keys[pygame.K_d] or keys[pygame.K_RIGHT]:
             move.x += 1
         if move.length_squared() > 0:
-            move = move.normalize()
-            new_pos = self.player_pos + move * dt * 4
-            if self.is_walkable(new_pos):
-                self.player_pos = new_pos
-        self.center_camera_on_player()
+            self.move_player(move.normalize() * dt * settings.PLAYER_SPEED)
+        if isinstance(self.grid, StreamingWorld):
+            self.stream_chunks()
+        self.update_pursuers(dt)
+        if self.fov is not None and self.fov.update(self.player_tile()):
+            self.fog.patch()
         if self.toast_timer > 0:
             self.toast_timer -= dt
+        self.autosave_timer += dt
+        if self.autosave_timer >= settings.AUTOSAVE_SECONDS:
+            self.autosave_timer = 0.0
+            self.app.autosave()
 
     def draw(self, surface: pygame.Surface) -> None:
-        dungeon_surface = pygame.Surface(
-            (len(self.grid[0]) * self.renderer.tile_size, len(self.grid) * self.renderer.tile_size)
-        )
-        self.renderer.draw(dungeon_surface, self.grid)
-        player_rect = pygame.Rect(
-            int(self.player_pos.x * self.renderer.tile_size),
-            int(self.player_pos.y * self.renderer.tile_size),
-            self.renderer.tile_size,
-            self.renderer.tile_size,
-        )
-        pygame.draw.rect(dungeon_surface, (220, 180, 70), player_rect.inflate(-16, -16), border_radius=8)
-        surface.blit(dungeon_surface, (0, 0), self.camera)
+        alpha = min(1.0, max(0.0, self.app.render_alpha))
+        player_pos = self.prev_player_pos.lerp(self.player_pos, alpha)
+        self.center_camera(player_pos)
+        surface.fill(self.renderer.background_color)
+        self.renderer.draw_view(surface, self.grid, self.camera)
+        if self.fog is not None:
+            self.fog.draw(surface, self.camera)
+        size = self.renderer.tile_size
+        sprites = [("player", (int(player_pos.x * size) - self.camera.x, int(player_pos.y * size) - self.camera.y))]
+        for previous, current in zip(self.prev_pursuers, self.pursuers):
+            if self.fov is not None and not self.fov.is_visible(round(current.x), round(current.y)):
+                continue
+            pursuer = previous.lerp(current, alpha)
+            sprites.append(("pursuer", (int(pursuer.x * size) - self.camera.x, int(pursuer.y * size) - self.camera.y)))
+        self.renderer.sprites.blits(surface, sprites)
 
         if self.toast_timer > 0:
-            text = self.font.render(self.toast_text, True, settings.WHITE)
+            text = render_text(self.font, self.toast_text, True, settings.WHITE)
             surface.blit(text, (20, 20))
         if self.log:
             self.draw_log(surface)
@@ -96,34 +224,80 @@ class WorldState(GameState):
         log_rect = pygame.Rect(20, base_y - 10, 420, 140)
         pygame.draw.rect(surface, (18, 20, 26), log_rect)
         pygame.draw.rect(surface, settings.ACCENT, log_rect, 2)
-        for i, line in enumerate(self.log[-5:]):
-            text = self.font.render(line, True, settings.LIGHT_GREY)
+        for i, line in enumerate(self.log.tail(5)):
+            text = render_text(self.font, line, True, settings.LIGHT_GREY)
             surface.blit(text, (log_rect.x + 12, log_rect.y + 12 + i * 24))
 
-    def center_camera_on_player(self) -> None:
-        px = int(self.player_pos.x * self.renderer.tile_size)
-        py = int(self.player_pos.y * self.renderer.tile_size)
+    def center_camera(self, pos: pygame.Vector2) -> None:
+        px = int(pos.x * self.renderer.tile_size)
+        py = int(pos.y * self.renderer.tile_size)
         self.camera.center = (px, py)
-        world_w = len(self.grid[0]) * self.renderer.tile_size
-        world_h = len(self.grid) * self.renderer.tile_size
+        if self.grid.width is None:
+            return
+        world_w = self.grid.width * self.renderer.tile_size
+        world_h = self.grid.height * self.renderer.tile_size
         self.camera.clamp_ip(pygame.Rect(0, 0, world_w, world_h))
 
+    def snapshot_positions(self) -> None:
+        """Remember positions before a simulation step so drawing can interpolate."""
+        self.prev_player_pos.update(self.player_pos)
+        self.prev_pursuers = [pursuer.copy() for pursuer in self.pursuers]
+
+    def move_player(self, delta: pygame.Vector2) -> None:
+        # Axis-separated sub-steps of at most half a tile: the player slides
+        # along walls and can never skip over one, whatever the step size.
+        substeps = max(1, math.ceil(max(abs(delta.x), abs(delta.y)) / 0.5))
+        part = delta / substeps
+        for _ in range(substeps):
+            if self.is_walkable(pygame.Vector2(self.player_pos.x + part.x, self.player_pos.y)):
+                self.player_pos.x += part.x
+            if self.is_walkable(pygame.Vector2(self.player_pos.x, self.player_pos.y + part.y)):
+                self.player_pos.y += part.y
+
+    def player_tile(self) -> Tuple[int, int]:
+        return math.floor(self.player_pos.x), math.floor(self.player_pos.y)
+
+    def update_pursuers(self, dt: float) -> None:
+        if not self.pursuers:
+            return
+        self.flow_field.update(self.player_tile())
+        step = settings.PURSUER_SPEED * dt
+        caught = []
+        for i, pursuer in enumerate(self.pursuers):
+            next_tile = self.flow_field.next_tile((round(pursuer.x), round(pursuer.y)))
+            if next_tile is not None:
+                pursuer.move_towards_ip(next_tile, step)
+            elif self.flow_field.distance((round(pursuer.x), round(pursuer.y))) == 0:
+                pursuer.move_towards_ip(self.player_pos, step)
+            if pursuer.distance_squared_to(self.player_pos) < 0.5:
+                caught.append(i)
+        for i in reversed(caught):
+            del self.pursuers[i]
+            del self.prev_pursuers[i]
+            self.toast("Ambushed!", 2.0)
+            self.initiate_combat()
+
+    def stream_chunks(self) -> None:
+        x, y = self.player_tile()
+        chunk = self.grid.chunk_of(x, y)
+        if chunk != self.player_chunk:
+            self.player_chunk = chunk
+            self.grid.ensure_around(x, y)
+
     def is_walkable(self, pos: pygame.Vector2) -> bool:
-        x = int(pos.x)
-        y = int(pos.y)
-        if y < 0 or y >= len(self.grid) or x < 0 or x >= len(self.grid[0]):
-            return False
-        return self.grid[y][x] == TILE_FLOOR
+        return self.grid.is_walkable(math.floor(pos.x), math.floor(pos.y))
 
     def initiate_combat(self) -> None:
         if not self.app.player_party:
             self.toast("No party configured!", 2.0)
             return
         templates = ["Ash Wraith", "Vault Sentry", "Hollow Corsair"]
-        encounter = [instantiate_enemy(random.choice(templates)) for _ in range(random.randint(1, 3))]
-        simulator = CombatSimulator(list(self.app.player_party), encounter)
+        rng = self.app.rng.stream("encounter")
+        encounter = [instantiate_enemy(rng.choice(templates), rng) for _ in range(rng.randint(1, 3))]
+        simulator = CombatSimulator(
+            list(self.app.player_party), encounter, log=self.log, rng=self.app.rng.stream("combat")
+        )
         simulator.run_round()
-        log = [entry.format() for entry in simulator.log]
         if simulator.victory():
             self.toast("Encounter cleared!", 2.0)
         elif simulator.defeat():
@@ -131,13 +305,12 @@ class WorldState(GameState):
         if simulator.defeated:
             loot = sum(enemy.gold_reward for enemy in simulator.defeated)
             self.app.gold += loot
-            log.append(f"Loot recovered: {loot} gold")
+            self.log.append("Party", "recovers gold", loot)
             for enemy in simulator.defeated:
                 template = ENEMIES.get(enemy.name)
                 if not template:
                     continue
                 for item_name, chance in template.loot.items.items():
-                    if random.random() <= chance:
+                    if self.app.rng.stream("loot").random() <= chance:
                         self.app.inventory[item_name] = self.app.inventory.get(item_name, 0) + 1
-                        log.append(f"Salvaged {item_name}")
-        self.log = log
+                        self.log.append("Party", f"salvages {item_name}")
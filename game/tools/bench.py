@@ -0,0 +1,254 @@
+"""Headless micro-benchmarks for the engine's hot paths, with JSON baselines.
+
+Each benchmark is timed like ``timeit``: the loop count is grown until one
+repeat takes at least ``--min-time`` seconds, and the median per-call time
+over ``--repeat`` repeats is reported. With ``--baseline`` results are
+compared against a previous run and anything slower by more than
+``--threshold`` is flagged (and the exit status is 1); ``--save`` writes the
+current results as the new baseline.
+
+    python -m game.tools.bench --save
+    python -m game.tools.bench --threshold 0.1
+    python -m game.tools.bench -k dungeon
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+from functools import partial
+from time import perf_counter
+from typing import Callable, Dict, List
+
+import pygame
+
+from game import settings
+from game.core.combat import CombatLog, CombatSimulator
+from game.core.entities import PlayerCharacter, instantiate_enemy
+from game.core.rng import RngStreams
+from game.core.world import generate_dungeon
+from game.data.classes import BASE_ARCHETYPES
+from game.ui.components import GridRenderer
+from game.ui.text import TextLayoutEngine, wrap_text
+
+DEFAULT_BASELINE = "bench_baseline.json"
+DUNGEON_SIZES = ((20, 12, "scatter"), (100, 60, "bsp"), (500, 500, "bsp"))
+
+Bench = Callable[[], None]
+
+BENCHMARKS: Dict[str, Callable[[], Bench]] = {}
+
+
+def benchmark(name: str):
+    """Register a setup function that returns the callable to time."""
+
+    def register(setup: Callable[[], Bench]) -> Callable[[], Bench]:
+        BENCHMARKS[name] = setup
+        return setup
+
+    return register
+
+
+_APP = None
+_SAVE_DIR: tempfile.TemporaryDirectory | None = None
+
+
+def _app():
+    """The shared headless :class:`GameApp`, created on first use.
+
+    Its saves, floor archive and combat history go to a throwaway directory,
+    so benchmarking never touches the player's ``saves/``.
+    """
+    global _APP, _SAVE_DIR
+    if _APP is None:
+        # Imported lazily: main.py pulls in every state.
+        from main import GameApp
+
+        _SAVE_DIR = tempfile.TemporaryDirectory(prefix="topdown-bench-")
+        settings.SAVE_DIR = _SAVE_DIR.name
+        _APP = GameApp(headless=True, seed=0)
+    return _APP
+
+
+def _dungeon(width: int, height: int, placement: str) -> Bench:
+    return lambda: generate_dungeon(0, width, height, placement=placement)
+
+
+for _width, _height, _placement in DUNGEON_SIZES:
+    BENCHMARKS[f"generate_dungeon_{_width}x{_height}_{_placement}"] = partial(_dungeon, _width, _height, _placement)
+
+
+@benchmark("grid_renderer_draw")
+def _grid_draw() -> Bench:
+    grid, _ = generate_dungeon(0)
+    renderer = GridRenderer()
+    surface = pygame.Surface((grid.width * renderer.tile_size, grid.height * renderer.tile_size))
+    return lambda: renderer.draw(surface, grid)
+
+
+@benchmark("world_state_draw")
+def _world_draw() -> Bench:
+    app = _app()
+    app.state_machine.switch("menu")
+    app.state_machine.current.start_new_game()
+    state = app.state_machine.current
+    state.update(1 / settings.SIM_HZ)
+    return lambda: state.draw(app.screen)
+
+
+@benchmark("menu_frame")
+def _menu_frame() -> Bench:
+    app = _app()
+    app.state_machine.switch("menu")
+    step = 1 / settings.SIM_HZ
+
+    def frame() -> None:
+        app.state_machine.update(step)
+        app.state_machine.draw(app.screen)
+
+    return frame
+
+
+@benchmark("combat_run_round")
+def _combat_round() -> Bench:
+    rng = RngStreams(0).stream("combat")
+    party = [PlayerCharacter(codename=name, archetype=archetype) for name, archetype in BASE_ARCHETYPES.items()][:3]
+    templates = ["Ash Wraith", "Vault Sentry", "Hollow Corsair"]
+    log = CombatLog()
+
+    def fight() -> None:
+        # Fresh combatants each call so every round does the same amount of work.
+        for hero in party:
+            hero.recalculate_stats()
+        enemies = [instantiate_enemy(name, rng) for name in templates]
+        CombatSimulator(list(party), enemies, log=log, rng=rng).run_round()
+
+    return fight
+
+
+_ABILITY_TEXT = " ".join(
+    ability.description for archetype in BASE_ARCHETYPES.values() for ability in archetype.abilities
+)
+
+
+@benchmark("wrap_text")
+def _wrap_text() -> Bench:
+    font = pygame.font.Font(settings.FONT_PATH, 22)
+    return lambda: wrap_text(_ABILITY_TEXT, font, 420)
+
+
+@benchmark("wrap_text_uncached")
+def _wrap_text_uncached() -> Bench:
+    font = pygame.font.Font(settings.FONT_PATH, 22)
+    return lambda: TextLayoutEngine._break_lines(_ABILITY_TEXT, font, 420)
+
+
+@benchmark("recalculate_stats")
+def _recalculate_stats() -> Bench:
+    from game.data.items import ITEMS
+
+    hero = PlayerCharacter(codename="Bench", archetype=next(iter(BASE_ARCHETYPES.values())))
+    for name, item in ITEMS.items():
+        slot = item.category.lower()
+        if slot in ("weapon", "shield", "accessory") and not hero.equipped.get(slot):
+            hero.equipped[slot] = name
+    return hero.recalculate_stats
+
+
+@benchmark("equip_swap")
+def _equip_swap() -> Bench:
+    from game.data.items import ITEMS, Item
+
+    # The catalogue has a single weapon; a bench-only second one makes this a
+    # real swap that touches different stats, a pool among them.
+    ITEMS.setdefault(
+        "Bench Cleaver", Item("Bench Cleaver", "Weapon", "Benchmark fixture.", 0, {"strength": 4, "hp": 10})
+    )
+    hero = PlayerCharacter(codename="Bench", archetype=next(iter(BASE_ARCHETYPES.values())))
+    weapons = ["Iron Sabre", "Bench Cleaver"]
+
+    def swap() -> None:
+        for name in weapons:
+            hero.equip("weapon", name)
+
+    return swap
+
+
+def measure(bench: Bench, repeat: int, min_time: float) -> Dict[str, float]:
+    loops = 1
+    while True:
+        start = perf_counter()
+        for _ in range(loops):
+            bench()
+        elapsed = perf_counter() - start
+        if elapsed >= min_time:
+            break
+        loops *= 2 if elapsed <= 0 else max(2, min(10, int(min_time / elapsed) + 1))
+    times = [elapsed / loops]
+    for _ in range(repeat - 1):
+        start = perf_counter()
+        for _ in range(loops):
+            bench()
+        times.append((perf_counter() - start) / loops)
+    return {"median": statistics.median(times), "min": min(times), "loops": loops}
+
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], threshold: float) -> List[str]:
+    """Names of benchmarks whose median is more than ``threshold`` slower than the baseline."""
+    return [
+        name
+        for name, result in results.items()
+        if name in baseline and result["median"] > baseline[name]["median"] * (1 + threshold)
+    ]
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-k", "--filter", default="", help="only run benchmarks whose name contains this")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds per repeat")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--threshold", type=float, default=0.15, help="allowed slowdown, e.g. 0.15 = 15%%")
+    parser.add_argument("--save", action="store_true", help="write these results as the new baseline")
+    args = parser.parse_args(argv)
+
+    _app()
+
+    baseline: Dict[str, dict] = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as handle:
+            baseline = json.load(handle)["results"]
+
+    results: Dict[str, dict] = {}
+    for name, setup in BENCHMARKS.items():
+        if args.filter not in name:
+            continue
+        results[name] = measure(setup(), args.repeat, args.min_time)
+        line = f"{name:<40} {results[name]['median'] * 1e6:12.1f} us"
+        if name in baseline:
+            change = results[name]["median"] / baseline[name]["median"] - 1
+            line += f"  {change:+7.1%}"
+        print(line, flush=True)
+
+    regressions = compare(results, baseline, args.threshold)
+    for name in regressions:
+        print(f"REGRESSION {name}: slower than baseline by more than {args.threshold:.0%}")
+
+    if args.save:
+        data = {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "machine": platform.machine(),
+            "results": {**baseline, **results},
+        }
+        with open(args.baseline, "w", encoding="utf-8") as handle:
+            json.dump(data, handle, indent=2, sort_keys=True)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,167 @@
+"""Headless matchup matrix: every party x loadout x enemy template x encounter size.
+
+Each cell is simulated with :func:`game.core.balance.simulate_encounters` in a
+process pool, under the game's initiative-ordered combat unless ``--phased``
+asks for the legacy heroes-then-enemies model. Results are appended to a JSON
+Lines file as they finish, so an interrupted run picks up where it stopped
+when started again with the same ``--out``; a CSV pivot of win rates for the
+chosen model is written alongside at the end.
+
+    python -m game.tools.matchups --fights 20000 --loadouts --workers 8
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import itertools
+import json
+import os
+import pathlib
+import zlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+from game.core.balance import simulate_encounters
+from game.core.entities import PlayerCharacter
+from game.data.classes import BASE_ARCHETYPES
+from game.data.enemies import ENEMIES
+from game.data.items import ITEMS
+
+PARTY_SIZE = 3
+EQUIPPABLE = ("Weapon", "Shield", "Accessory")
+
+Task = Tuple[Tuple[str, ...], Tuple[str, ...], str, int, str]
+
+MODEL_INITIATIVE = "initiative"
+MODEL_PHASED = "phased"
+
+
+def parties(size: int = PARTY_SIZE, duplicates: bool = False) -> List[Tuple[str, ...]]:
+    names = sorted(BASE_ARCHETYPES)
+    combos = itertools.combinations_with_replacement if duplicates else itertools.combinations
+    return list(combos(names, size))
+
+
+def loadouts(size: int = PARTY_SIZE) -> List[Tuple[str, ...]]:
+    """Every way to give each hero one equippable item or nothing (``""``)."""
+    gear = [""] + sorted(name for name, item in ITEMS.items() if item.category in EQUIPPABLE)
+    return list(itertools.product(gear, repeat=size))
+
+
+def build_party(archetypes: Sequence[str], loadout: Sequence[str]) -> List[PlayerCharacter]:
+    party = []
+    for i, (name, item_name) in enumerate(zip(archetypes, loadout)):
+        hero = PlayerCharacter(codename=f"{name}-{i}", archetype=BASE_ARCHETYPES[name])
+        if item_name:
+            hero.equip(ITEMS[item_name].category.lower(), item_name)
+        party.append(hero)
+    return party
+
+
+def task_key(task: Task) -> str:
+    archetypes, loadout, template, count, model = task
+    return f"{'+'.join(archetypes)}|{'+'.join(item or '-' for item in loadout)}|{template}|{count}|{model}"
+
+
+def task_seed(base_seed: int, task: Task) -> np.random.SeedSequence:
+    # Seeded from the task itself, so results do not depend on scheduling order.
+    return np.random.SeedSequence([base_seed, zlib.crc32(task_key(task).encode())])
+
+
+def run_task(task: Task, fights: int, base_seed: int, max_rounds: int) -> Dict[str, object]:
+    archetypes, loadout, template, count, model = task
+    heroes = build_party(archetypes, loadout)
+    result = simulate_encounters(
+        heroes, template, count, fights, task_seed(base_seed, task), max_rounds, model == MODEL_INITIATIVE
+    )
+    row = result.summary()
+    row.update(key=task_key(task), party=list(archetypes), loadout=list(loadout), model=model)
+    return row
+
+
+def iter_tasks(args: argparse.Namespace) -> Iterator[Task]:
+    gear = loadouts() if args.loadouts else [("",) * PARTY_SIZE]
+    model = MODEL_PHASED if args.phased else MODEL_INITIATIVE
+    for archetypes in parties(duplicates=args.duplicates):
+        for loadout in gear:
+            for template in sorted(ENEMIES):
+                for count in args.sizes:
+                    yield archetypes, loadout, template, count, model
+
+
+def completed_keys(path: pathlib.Path) -> set:
+    if not path.exists():
+        return set()
+    keys = set()
+    with path.open() as handle:
+        for line in handle:
+            try:
+                keys.add(json.loads(line)["key"])
+            except (ValueError, KeyError):
+                # A torn last line from an interrupted run; the task is redone.
+                continue
+    return keys
+
+
+def write_matrix(results_path: pathlib.Path, matrix_path: pathlib.Path, model: str = MODEL_INITIATIVE) -> None:
+    rows: Dict[Tuple[str, str], Dict[str, float]] = {}
+    columns = set()
+    with results_path.open() as handle:
+        for line in handle:
+            try:
+                row = json.loads(line)
+            except ValueError:
+                continue
+            # Rows written before the model was recorded are phased results.
+            if row.get("model", MODEL_PHASED) != model:
+                continue
+            column = f"{row['template']} x{row['enemy_count']}"
+            columns.add(column)
+            party = "+".join(row["party"])
+            loadout = "+".join(item or "-" for item in row["loadout"])
+            rows.setdefault((party, loadout), {})[column] = row["win_rate"]
+    ordered = sorted(columns)
+    with matrix_path.open("w", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(["party", "loadout"] + ordered)
+        for (party, loadout), cells in sorted(rows.items()):
+            writer.writerow([party, loadout] + [cells.get(column, "") for column in ordered])
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fights", type=int, default=10000, help="encounters simulated per cell")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 2, 3], help="enemies per encounter")
+    parser.add_argument("--loadouts", action="store_true", help="cross parties with every item loadout")
+    parser.add_argument("--duplicates", action="store_true", help="allow repeated archetypes in a party")
+    parser.add_argument("--max-rounds", type=int, default=100)
+    parser.add_argument(
+        "--phased", action="store_true", help="simulate the legacy heroes-then-enemies rounds, not initiative order"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--out", type=pathlib.Path, default=pathlib.Path("matchups.jsonl"))
+    args = parser.parse_args(argv)
+
+    done = completed_keys(args.out)
+    tasks = [task for task in iter_tasks(args) if task_key(task) not in done]
+    model = MODEL_PHASED if args.phased else MODEL_INITIATIVE
+    print(f"Combat model: {model}; {len(done)} cells already done, {len(tasks)} to run")
+
+    with args.out.open("a") as out, ProcessPoolExecutor(max_workers=args.workers) as pool:
+        futures = [pool.submit(run_task, task, args.fights, args.seed, args.max_rounds) for task in tasks]
+        for finished, future in enumerate(as_completed(futures), 1):
+            row = future.result()
+            out.write(json.dumps(row) + "\n")
+            out.flush()
+            print(f"[{finished}/{len(tasks)}] {row['key']}: win rate {row['win_rate']:.3f}")
+
+    matrix_path = args.out.with_suffix(".csv")
+    write_matrix(args.out, matrix_path, model)
+    print(f"Matrix written to {matrix_path}")
+
+
+if __name__ == "__main__":
+    main()
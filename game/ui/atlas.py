@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+import pygame
+
+from game import settings
+from game.core.world import TILE_WALL
+from game.ui.surfaces import to_display_format
+
+ColorLike = Tuple[int, ...]
+
+# Wall variants are indexed by which orthogonal neighbours are also walls.
+WALL_N, WALL_E, WALL_S, WALL_W = 1, 2, 4, 8
+FLOOR_VARIANT = 0
+WALL_VARIANTS = 16
+
+
+class TextureAtlas:
+    """Named images packed into one surface and drawn with ``Surface.blits``.
+
+    Images are placed on shelves left to right, wrapping at ``max_width``.
+    The atlas only carries per-pixel alpha if one of its images does, since
+    opaque blits are much cheaper.
+    """
+
+    def __init__(self, images: Dict[str, pygame.Surface], max_width: int = 1024, padding: int = 1) -> None:
+        self.areas: Dict[str, pygame.Rect] = {}
+        x = y = shelf_height = 0
+        for name, image in images.items():
+            width, height = image.get_size()
+            if x and x + width > max_width:
+                x, y, shelf_height = 0, y + shelf_height + padding, 0
+            self.areas[name] = pygame.Rect(x, y, width, height)
+            x += width + padding
+            shelf_height = max(shelf_height, height)
+        atlas_width = max((rect.right for rect in self.areas.values()), default=1)
+        atlas_height = max((rect.bottom for rect in self.areas.values()), default=1)
+        alpha = any(image.get_flags() & pygame.SRCALPHA for image in images.values())
+        surface = pygame.Surface((atlas_width, atlas_height), pygame.SRCALPHA if alpha else 0)
+        for name, image in images.items():
+            surface.blit(image, self.areas[name])
+        self.surface = to_display_format(surface)
+
+    def area(self, name: str) -> pygame.Rect:
+        return self.areas[name]
+
+    def blits(self, target: pygame.Surface, sprites: Iterable[Tuple[str, Tuple[int, int]]]) -> None:
+        """Draw ``(name, position)`` pairs onto ``target`` in one batch."""
+        texture, areas = self.surface, self.areas
+        target.blits([(texture, pos, areas[name]) for name, pos in sprites], doreturn=False)
+
+
+def wall_variants(tiles: np.ndarray) -> np.ndarray:
+    """Autotile index for every tile of a ``(height + 2, width + 2)`` padded block.
+
+    The one-tile border only supplies neighbours; the result covers the inner
+    ``(height, width)`` tiles. Floors map to :data:`FLOOR_VARIANT` and walls to
+    ``1 + mask``, where ``mask`` has a ``WALL_*`` bit per neighbouring wall.
+    """
+    walls = tiles == TILE_WALL
+    mask = (
+        walls[:-2, 1:-1] * WALL_N
+        | walls[1:-1, 2:] * WALL_E
+        | walls[2:, 1:-1] * WALL_S
+        | walls[1:-1, :-2] * WALL_W
+    )
+    return np.where(walls[1:-1, 1:-1], 1 + mask, FLOOR_VARIANT).astype(np.uint8)
+
+
+def map_variants(tiles: np.ndarray) -> np.ndarray:
+    """:func:`wall_variants` for a whole map; tiles beyond the edge count as walls."""
+    return wall_variants(np.pad(tiles, 1, constant_values=TILE_WALL))
+
+
+def build_tileset(
+    tile_size: int,
+    floor_color: ColorLike,
+    wall_color: ColorLike,
+    grid_color: ColorLike,
+    edge_color: ColorLike = (70, 88, 100),
+) -> Tuple[TextureAtlas, List[pygame.Rect]]:
+    """Procedural floor and autotiled wall tiles packed into an atlas.
+
+    Returns the atlas and its tile areas indexed by autotile variant, so
+    renderers can go straight from :func:`wall_variants` output to blits.
+    """
+    images: Dict[str, pygame.Surface] = {"floor": _tile(tile_size, floor_color, grid_color)}
+    edge = max(2, tile_size // 16)
+    for mask in range(WALL_VARIANTS):
+        tile = _tile(tile_size, wall_color, grid_color)
+        # Highlight the sides that face open floor.
+        if not mask & WALL_N:
+            tile.fill(edge_color, (0, 0, tile_size, edge))
+        if not mask & WALL_S:
+            tile.fill(edge_color, (0, tile_size - edge, tile_size, edge))
+        if not mask & WALL_W:
+            tile.fill(edge_color, (0, 0, edge, tile_size))
+        if not mask & WALL_E:
+            tile.fill(edge_color, (tile_size - edge, 0, edge, tile_size))
+        images[f"wall_{mask}"] = tile
+    atlas = TextureAtlas(images)
+    areas = [atlas.area("floor")] + [atlas.area(f"wall_{mask}") for mask in range(WALL_VARIANTS)]
+    return atlas, areas
+
+
+def build_sprites(tile_size: int) -> TextureAtlas:
+    """Procedural actor sprites, one tile in size."""
+    return TextureAtlas(
+        {
+            "player": _token(tile_size, (220, 180, 70), 16, 8),
+            "pursuer": _token(tile_size, settings.ERROR, 20, 6),
+        }
+    )
+
+
+def _tile(size: int, color: ColorLike, grid_color: ColorLike) -> pygame.Surface:
+    tile = pygame.Surface((size, size))
+    tile.fill(color)
+    pygame.draw.rect(tile, grid_color, tile.get_rect(), 1)
+    return tile
+
+
+def _token(size: int, color: ColorLike, inset: int, radius: int) -> pygame.Surface:
+    token = pygame.Surface((size, size), pygame.SRCALPHA)
+    pygame.draw.rect(token, color, token.get_rect().inflate(-inset, -inset), border_radius=radius)
+    return token
@@ -1,11 +1,21 @@
 from __future__ import annotations
 
+import math
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Callable, List, Tuple
 
+import numpy as np
 import pygame
 
 from game import settings
+from game.core.fov import FieldOfView
+from game.core.streaming import StreamingWorld
+from game.core.world import TileGrid
+from game.profiler import FrameProfiler
+from game.ui.atlas import build_sprites, build_tileset, map_variants, wall_variants
+from game.ui.surfaces import to_display_format
+from game.ui.text import render_text
 
 
 @dataclass
@@ -18,7 +28,7 @@ class Button:
     def draw(self, surface: pygame.Surface, font: pygame.font.Font, hover: bool = False) -> None:
         color = settings.ACCENT if hover else settings.LIGHT_GREY
         pygame.draw.rect(surface, color, self.rect, border_radius=8, width=2)
-        text_surf = font.render(self.label, True, color)
+        text_surf = render_text(font, self.label, True, color)
         surface.blit(text_surf, text_surf.get_rect(center=self.rect.center))
 
     def contains(self, pos: Tuple[int, int]) -> bool:
@@ -26,17 +36,246 @@ class Button:
 
 
 class GridRenderer:
-    def __init__(self, tile_size: int = settings.GRID_SIZE) -> None:
+    """Draws a tile grid as a set of cached chunk surfaces.
+
+    Only the chunks that intersect the camera are touched each frame, and
+    rendered chunks are kept in an LRU bounded by ``cache_bytes``. Tiles come
+    from an autotiled atlas; the variant of every tile in a bounded grid is
+    worked out once per grid version.
+    """
+
+    def __init__(
+        self,
+        tile_size: int = settings.GRID_SIZE,
+        chunk_tiles: int = settings.RENDER_CHUNK_TILES,
+        cache_bytes: int = settings.RENDER_CACHE_BYTES,
+    ) -> None:
         self.tile_size = tile_size
+        self.chunk_tiles = chunk_tiles
+        self.cache_bytes = cache_bytes
         self.floor_color = (48, 62, 71)
         self.wall_color = (18, 28, 36)
         self.grid_color = (32, 42, 52)
+        self.background_color = (12, 16, 24)
+        self.atlas, self._tile_areas = build_tileset(tile_size, self.floor_color, self.wall_color, self.grid_color)
+        self.sprites = build_sprites(tile_size)
+        self._variants: np.ndarray | None = None
+        self._chunks: "OrderedDict[Tuple[int, int], pygame.Surface]" = OrderedDict()
+        self._chunk_bytes = 0
+        self._grid: TileGrid | StreamingWorld | None = None
+        self._grid_version = -1
+
+    @property
+    def cached_bytes(self) -> int:
+        return self._chunk_bytes
+
+    def invalidate(self, region: pygame.Rect | None = None) -> None:
+        """Drop cached chunks, or only those overlapping ``region`` (in tiles)."""
+        if region is None:
+            self._chunks.clear()
+            self._chunk_bytes = 0
+            return
+        size = self.chunk_tiles
+        for cy in range(region.top // size, (region.bottom - 1) // size + 1):
+            for cx in range(region.left // size, (region.right - 1) // size + 1):
+                self._evict((cx, cy))
+
+    def draw_view(self, surface: pygame.Surface, grid: TileGrid | StreamingWorld, camera: pygame.Rect) -> None:
+        """Blit the chunks visible through ``camera`` (in world pixels) onto ``surface``."""
+        self._sync(grid)
+        chunk_px = self.chunk_tiles * self.tile_size
+        x0 = camera.left // chunk_px
+        y0 = camera.top // chunk_px
+        x1 = (camera.right - 1) // chunk_px
+        y1 = (camera.bottom - 1) // chunk_px
+        if grid.width is not None:
+            # Bounded grids clip to their edges; streaming worlds have none.
+            x0, x1 = max(0, x0), min((grid.width - 1) // self.chunk_tiles, x1)
+            y0, y1 = max(0, y0), min((grid.height - 1) // self.chunk_tiles, y1)
+        visible = 0
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                chunk = self._chunk(grid, cx, cy)
+                surface.blit(chunk, (cx * chunk_px - camera.x, cy * chunk_px - camera.y))
+                visible += 1
+        self._trim(keep=visible)
+
+    def draw(self, surface: pygame.Surface, grid: TileGrid) -> None:
+        self._sync(grid)
+        surface.fill(self.background_color)
+        self._paint(surface, grid, 0, 0, grid.width, grid.height)
+
+    def _sync(self, grid: TileGrid | StreamingWorld) -> None:
+        if grid is self._grid and grid.version == self._grid_version:
+            return
+        self.invalidate()
+        self._grid = grid
+        self._grid_version = grid.version
+        # Streaming worlds have no whole-map array; their chunks autotile on demand.
+        self._variants = map_variants(grid.tiles) if grid.width is not None else None
+
+    def _chunk(self, grid: TileGrid | StreamingWorld, cx: int, cy: int) -> pygame.Surface:
+        key = (cx, cy)
+        chunk = self._chunks.get(key)
+        if chunk is not None:
+            self._chunks.move_to_end(key)
+            return chunk
+        x0 = cx * self.chunk_tiles
+        y0 = cy * self.chunk_tiles
+        x1 = x0 + self.chunk_tiles
+        y1 = y0 + self.chunk_tiles
+        if grid.width is not None:
+            x1 = min(grid.width, x1)
+            y1 = min(grid.height, y1)
+        chunk = pygame.Surface(((x1 - x0) * self.tile_size, (y1 - y0) * self.tile_size))
+        self._paint(chunk, grid, x0, y0, x1, y1)
+        chunk = to_display_format(chunk)
+        self._chunks[key] = chunk
+        self._chunk_bytes += chunk.get_width() * chunk.get_height() * chunk.get_bytesize()
+        return chunk
+
+    def _paint(self, surface: pygame.Surface, grid: TileGrid | StreamingWorld, x0: int, y0: int, x1: int, y1: int) -> None:
+        if self._variants is not None:
+            variants = self._variants[y0:y1, x0:x1]
+        else:
+            variants = wall_variants(grid.region(x0 - 1, y0 - 1, x1 + 1, y1 + 1))
+        size = self.tile_size
+        texture, areas = self.atlas.surface, self._tile_areas
+        surface.blits(
+            [
+                (texture, (x * size, y * size), areas[variant])
+                for y, row in enumerate(variants.tolist())
+                for x, variant in enumerate(row)
+            ],
+            doreturn=False,
+        )
+
+    def _evict(self, key: Tuple[int, int]) -> None:
+        chunk = self._chunks.pop(key, None)
+        if chunk is not None:
+            self._chunk_bytes -= chunk.get_width() * chunk.get_height() * chunk.get_bytesize()
+
+    def _trim(self, keep: int) -> None:
+        # The most recently used ``keep`` chunks are on screen and always survive.
+        while self._chunk_bytes > self.cache_bytes and len(self._chunks) > keep:
+            self._evict(next(iter(self._chunks)))
+
+
+class FogOverlay:
+    """Fog of war kept as a one-pixel-per-tile alpha mask.
+
+    The mask is patched only where a :class:`FieldOfView` reports changes,
+    and the camera-sized upscale is reused until the fog or the camera's tile
+    origin changes.
+    """
+
+    def __init__(
+        self,
+        fov: FieldOfView,
+        tile_size: int = settings.GRID_SIZE,
+        unexplored_alpha: int = 255,
+        remembered_alpha: int = 170,
+    ) -> None:
+        self.fov = fov
+        self.tile_size = tile_size
+        self.unexplored_alpha = unexplored_alpha
+        self.remembered_alpha = remembered_alpha
+        height, width = fov.visible.shape
+        self.mask = pygame.Surface((width, height), pygame.SRCALPHA)
+        self.mask.fill((0, 0, 0, unexplored_alpha))
+        self.version = 0
+        self._view: pygame.Surface | None = None
+        self._view_key: tuple | None = None
+
+    def patch(self, region: Tuple[int, int, int, int] | None = None) -> None:
+        """Refresh the mask for ``region`` (defaults to the FOV's last change)."""
+        region = region or self.fov.changed
+        if region is None:
+            return
+        x0, y0, x1, y1 = region
+        visible = self.fov.visible[y0:y1, x0:x1]
+        explored = self.fov.explored[y0:y1, x0:x1]
+        alpha = np.where(visible, 0, np.where(explored, self.remembered_alpha, self.unexplored_alpha))
+        pixels = pygame.surfarray.pixels_alpha(self.mask)
+        pixels[x0:x1, y0:y1] = alpha.T
+        del pixels
+        self.version += 1
+
+    def draw(self, surface: pygame.Surface, camera: pygame.Rect) -> None:
+        size = self.tile_size
+        width, height = self.mask.get_size()
+        tx0 = max(0, camera.left // size)
+        ty0 = max(0, camera.top // size)
+        tx1 = min(width, math.ceil(camera.right / size))
+        ty1 = min(height, math.ceil(camera.bottom / size))
+        if tx0 >= tx1 or ty0 >= ty1:
+            return
+        key = (tx0, ty0, tx1, ty1, self.version)
+        if key != self._view_key:
+            region = self.mask.subsurface((tx0, ty0, tx1 - tx0, ty1 - ty0))
+            self._view = pygame.transform.scale(region, ((tx1 - tx0) * size, (ty1 - ty0) * size))
+            self._view_key = key
+        surface.blit(self._view, (tx0 * size - camera.x, ty0 * size - camera.y))
+
+
+class ProfilerOverlay:
+    """Frame-time panel for a :class:`FrameProfiler`, toggled in-game with F3.
+
+    Percentile text is re-rendered every ``refresh`` frames rather than every
+    frame, so the overlay doesn't churn the text cache it helps diagnose.
+    """
+
+    def __init__(
+        self,
+        profiler: FrameProfiler,
+        font: pygame.font.Font,
+        graph_frames: int = 120,
+        refresh: int = 15,
+    ) -> None:
+        self.profiler = profiler
+        self.font = font
+        self.graph_frames = graph_frames
+        self.refresh = refresh
+        self.visible = False
+        self.size = (graph_frames * 2 + 20, 190)
+        self._lines: List[pygame.Surface] = []
+        self._lines_frame = -refresh
+
+    def toggle(self) -> None:
+        self.visible = not self.visible
+
+    def draw(self, surface: pygame.Surface, state: str) -> None:
+        if not self.visible:
+            return
+        width, height = self.size
+        panel = pygame.Rect(surface.get_width() - width - 10, 10, width, height)
+        surface.fill((8, 10, 14), panel)
+        pygame.draw.rect(surface, settings.LIGHT_GREY, panel, 1)
+
+        if self.profiler.frame_count - self._lines_frame >= self.refresh:
+            self._lines = [self.font.render(line, True, settings.LIGHT_GREY) for line in self._text(state)]
+            self._lines_frame = self.profiler.frame_count
+        y = panel.top + 6
+        for line in self._lines:
+            surface.blit(line, (panel.left + 10, y))
+            y += line.get_height()
+
+        graph = pygame.Rect(panel.left + 10, y + 6, width - 20, panel.bottom - y - 16)
+        budget_ms = 1000 / settings.FPS
+        scale = graph.height / (budget_ms * 2)
+        budget_y = graph.bottom - int(budget_ms * scale)
+        pygame.draw.line(surface, settings.ERROR, (graph.left, budget_y), (graph.right, budget_y))
+        frames = self.profiler.recent(self.graph_frames)
+        points = [
+            (graph.left + i * 2, graph.bottom - int(min(ms, budget_ms * 2) * scale))
+            for i, ms in enumerate(frames)
+        ]
+        if len(points) > 1:
+            pygame.draw.lines(surface, settings.ACCENT, False, points)
 
-    def draw(self, surface: pygame.Surface, grid: List[List[int]]) -> None:
-        surface.fill((12, 16, 24))
-        for y, row in enumerate(grid):
-            for x, value in enumerate(row):
-                rect = pygame.Rect(x * self.tile_size, y * self.tile_size, self.tile_size, self.tile_size)
-                color = self.floor_color if value == 0 else self.wall_color
-                pygame.draw.rect(surface, color, rect)
-                pygame.draw.rect(surface, self.grid_color, rect, 1)
+    def _text(self, state: str) -> List[str]:
+        lines = [f"state: {state}"]
+        for phase in ("frame", "update", "draw"):
+            p = self.profiler.percentiles(state, phase)
+            lines.append(f"{phase:<6} p50 {p[50]:5.1f}  p95 {p[95]:5.1f}  p99 {p[99]:5.1f} ms")
+        return lines
@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+import pygame
+
+
+def to_display_format(surface: pygame.Surface) -> pygame.Surface:
+    if pygame.display.get_surface() is None:
+        return surface
+    if surface.get_flags() & pygame.SRCALPHA:
+        return surface.convert_alpha()
+    return surface.convert()
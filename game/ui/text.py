@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from functools import lru_cache
+from typing import List, Tuple
+
+import pygame
+
+from game import settings
+from game.ui.surfaces import to_display_format
+
+ColorLike = pygame.Color | Tuple[int, ...]
+
+
+class TextCache:
+    """LRU of rendered text surfaces keyed by (font, text, antialias, colour).
+
+    Surfaces handed out are shared between callers and must not be drawn on.
+    """
+
+    def __init__(self, max_bytes: int = settings.TEXT_CACHE_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def cached_bytes(self) -> int:
+        return self._bytes
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def get(self, key: tuple) -> pygame.Surface | None:
+        surf = self._entries.get(key)
+        if surf is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return surf
+
+    def put(self, key: tuple, surf: pygame.Surface) -> pygame.Surface:
+        self._entries[key] = surf
+        self._bytes += _surface_bytes(surf)
+        while self._bytes > self.max_bytes and len(self._entries) > 1:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= _surface_bytes(evicted)
+        return surf
+
+    def render(self, font: pygame.font.Font, text: str, antialias: bool, color: ColorLike) -> pygame.Surface:
+        key = (font, text, antialias, tuple(color))
+        surf = self.get(key)
+        if surf is None:
+            surf = self.put(key, to_display_format(font.render(text, antialias, color)))
+        return surf
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+
+def _surface_bytes(surf: pygame.Surface) -> int:
+    return surf.get_width() * surf.get_height() * surf.get_bytesize()
+
+
+text_cache = TextCache()
+
+
+def render_text(font: pygame.font.Font, text: str, antialias: bool, color: ColorLike) -> pygame.Surface:
+    """Render ``text`` through the shared :data:`text_cache`."""
+    return text_cache.render(font, text, antialias, color)
+
+
+class TextLayoutEngine:
+    """Word-wraps text and caches both the line breaks and composed paragraphs."""
+
+    def __init__(
+        self,
+        max_layouts: int = settings.TEXT_LAYOUT_CACHE_SIZE,
+        max_paragraph_bytes: int = settings.TEXT_CACHE_BYTES,
+    ) -> None:
+        self.max_layouts = max_layouts
+        self.paragraphs = TextCache(max_paragraph_bytes)
+        self._layouts: "OrderedDict[tuple, Tuple[str, ...]]" = OrderedDict()
+
+    def wrap(self, text: str, font: pygame.font.Font, width: int) -> Tuple[str, ...]:
+        key = (text, font, width)
+        lines = self._layouts.get(key)
+        if lines is not None:
+            self._layouts.move_to_end(key)
+            return lines
+        lines = self._break_lines(text, font, width)
+        self._layouts[key] = lines
+        if len(self._layouts) > self.max_layouts:
+            self._layouts.popitem(last=False)
+        return lines
+
+    def paragraph(
+        self,
+        text: str,
+        font: pygame.font.Font,
+        width: int,
+        color: ColorLike,
+        line_height: int | None = None,
+        antialias: bool = True,
+    ) -> pygame.Surface:
+        """Return ``text`` wrapped to ``width`` as one surface, ``line_height`` pixels per line."""
+        line_height = line_height or font.get_linesize()
+        key = (text, font, width, tuple(color), line_height, antialias)
+        surf = self.paragraphs.get(key)
+        if surf is not None:
+            return surf
+        lines = self.wrap(text, font, width)
+        surf = pygame.Surface((max(1, width), max(1, len(lines) * line_height)), pygame.SRCALPHA)
+        for i, line in enumerate(lines):
+            surf.blit(font.render(line, antialias, color), (0, i * line_height))
+        return self.paragraphs.put(key, to_display_format(surf))
+
+    @staticmethod
+    def _break_lines(text: str, font: pygame.font.Font, width: int) -> Tuple[str, ...]:
+        space = _word_width(font, " ")
+        lines: List[str] = []
+        current: List[str] = []
+        current_width = 0
+        for word in text.split():
+            word_width = _word_width(font, word)
+            if current and current_width + space + word_width > width:
+                lines.append(" ".join(current))
+                current = []
+            current_width = current_width + space + word_width if current else word_width
+            current.append(word)
+        if current:
+            lines.append(" ".join(current))
+        return tuple(lines)
+
+
+@lru_cache(maxsize=4096)
+def _word_width(font: pygame.font.Font, word: str) -> int:
+    return font.size(word)[0]
+
+
+layout_engine = TextLayoutEngine()
+
+
+def wrap_text(text: str, font: pygame.font.Font, width: int) -> List[str]:
+    return list(layout_engine.wrap(text, font, width))
+
+
+def render_paragraph(
+    text: str,
+    font: pygame.font.Font,
+    width: int,
+    color: ColorLike,
+    line_height: int | None = None,
+) -> pygame.Surface:
+    return layout_engine.paragraph(text, font, width, color, line_height)
@@ -1,76 +1,250 @@
 from __future__ import annotations
 
+import argparse
 import os
 import pathlib
-from typing import Dict, List
+import tempfile
+import time
+from typing import Dict, List, Sequence, Tuple
 
 import pygame
 
 from game import settings
-from game.state_machine import StateMachine
-from game.states.main_menu import MainMenuState
-from game.states.world import WorldState
-from game.states.pause_menu import PauseMenuState
-from game.states.skills_editor import SkillsEditorState
-from game.states.player_editor import PlayerEditorState
-from game.states.shop import ShopState
-from game.states.party import PartyManagementState
+from game.assets import AssetManager
+from game.core import save
+from game.core.rng import RngStreams
+from game.input import PygameInput, RandomInput
+from game.profiler import FrameProfiler
+from game.replay import InputRecorder, Replay
+from game.state_machine import LazyState, StateMachine
+from game.ui.components import ProfilerOverlay
 
 
 class GameApp:
     """High level application object that holds shared state."""
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        headless: bool = False,
+        input_source=None,
+        seed: int | None = None,
+        preload: bool = True,
+        resumable: bool | None = None,
+    ) -> None:
+        self.startup_times: Dict[str, float] = {}
+        self._created = self._last_mark = time.perf_counter()
+        self.headless = headless
+        self.preload = preload
+        # Offering "Resume" depends on files on disk, so it is left out of
+        # runs that must replay identically: bots, scripts and replays. Those
+        # also save into a throwaway directory, so they never overwrite the
+        # player's expedition.
+        self.resumable = (not headless and input_source is None) if resumable is None else resumable
+        self._scratch = None if self.resumable else tempfile.TemporaryDirectory(prefix="topdown-")
+        self.save_dir = settings.SAVE_DIR if self._scratch is None else self._scratch.name
+        if headless:
+            # Must be set before SDL initialises its video and audio subsystems.
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
         pygame.init()
         pygame.font.init()
+        self._mark("pygame.init")
         self.clock = pygame.time.Clock()
         self.screen = pygame.display.set_mode(
             (settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT)
         )
         pygame.display.set_caption(settings.TITLE)
+        self._mark("display")
 
         self.running = False
+        self.render_alpha = 1.0
+        self.ticks = 0
+        self.input = input_source or PygameInput()
+        self.rng = RngStreams(seed)
         self.state_machine = StateMachine(self)
-        self.assets: Dict[str, pygame.Surface] = {}
+        self.profiler = FrameProfiler()
+        self.state_machine.profiler = self.profiler
+        self.assets = AssetManager()
+        self.assets.preload("ui")
+        self.profiler_overlay = ProfilerOverlay(self.profiler, self.assets.font(18))
         self.player_party: List[dict] = []
         self.inventory: Dict[str, int] = {}
         self.gold = 120
         self.unlocked_skills: Dict[str, List[str]] = {}
 
         self._ensure_directories()
+        self.autosaver = save.Autosaver(os.path.join(self.save_dir, settings.AUTOSAVE_FILE))
         self._register_states()
+        self._mark("app setup")
 
     def _ensure_directories(self) -> None:
-        pathlib.Path(settings.SAVE_DIR).mkdir(parents=True, exist_ok=True)
+        pathlib.Path(self.save_dir).mkdir(parents=True, exist_ok=True)
         pathlib.Path(settings.ASSET_DIR).mkdir(parents=True, exist_ok=True)
 
     def _register_states(self) -> None:
-        self.state_machine.register("menu", MainMenuState)
-        self.state_machine.register("world", WorldState)
-        self.state_machine.register("pause", PauseMenuState)
-        self.state_machine.register("skills_editor", SkillsEditorState)
-        self.state_machine.register("player_editor", PlayerEditorState)
-        self.state_machine.register("shop", ShopState)
-        self.state_machine.register("party", PartyManagementState)
-
-    def run(self) -> None:
+        self.state_machine.register("menu", LazyState("game.states.main_menu", "MainMenuState"))
+        self.state_machine.register("world", LazyState("game.states.world", "WorldState"))
+        self.state_machine.register("pause", LazyState("game.states.pause_menu", "PauseMenuState"))
+        self.state_machine.register("skills_editor", LazyState("game.states.skills_editor", "SkillsEditorState"))
+        self.state_machine.register("player_editor", LazyState("game.states.player_editor", "PlayerEditorState"))
+        self.state_machine.register("shop", LazyState("game.states.shop", "ShopState"))
+        self.state_machine.register("party", LazyState("game.states.party", "PartyManagementState"))
+
+    def autosave(self) -> None:
+        """Snapshot the run now and write it in the background."""
+        self.autosaver.submit(save.snapshot(self))
+
+    def load_game(self, path: str | None = None) -> None:
+        """Load a save and switch to it; raises ``OSError`` or ``ValueError``, leaving the run untouched."""
+        data = save.load(path or self.autosaver.path)
+        party = save.restore_party(data.party)
+        self.rng.reseed(data.seed)
+        self.gold = data.gold
+        self.player_party = party
+        self.inventory = data.inventory
+        self.unlocked_skills = data.unlocked_skills
+        if data.world.kind == save.WORLD_NONE:
+            self.state_machine.switch("menu")
+            return
+        self.state_machine.get("world").restore(data.world)
+        self.state_machine.switch("world")
+
+    def _mark(self, label: str) -> None:
+        now = time.perf_counter()
+        self.startup_times[label] = now - self._last_mark
+        self._last_mark = now
+
+    def startup_report(self) -> str:
+        """Startup phases, then import and construction time of each built state."""
+        lines = [f"{label:<24} {seconds * 1000:8.1f} ms" for label, seconds in self.startup_times.items()]
+        for name, (imported, built) in self.state_machine.build_times.items():
+            total_ms = (imported + built) * 1000
+            lines.append(f"state {name:<18} {total_ms:8.1f} ms  (import {imported * 1000:.1f}, build {built * 1000:.1f})")
+        return "\n".join(lines)
+
+    def run(self, render: bool | None = None, max_steps: int | None = None) -> None:
+        """Main loop: fixed-rate simulation with interpolated rendering.
+
+        The simulation always advances in steps of ``1 / settings.SIM_HZ``.
+        When rendering, real elapsed time is banked and spent in whole steps
+        (at most ``settings.MAX_CATCHUP_STEPS`` per frame), and
+        ``render_alpha`` tells states how far to interpolate between the last
+        two steps. With ``render=False`` (the default for headless apps)
+        nothing is drawn and nothing waits on the clock, so the simulation
+        runs as fast as the CPU allows; ``max_steps`` stops it after that many
+        steps.
+        """
+        if render is None:
+            render = not self.headless
+        step = 1 / settings.SIM_HZ
+        max_backlog = step * settings.MAX_CATCHUP_STEPS
+        accumulator = 0.0
+        steps_run = 0
         self.running = True
         self.state_machine.switch("menu")
+        self._mark("menu state")
         while self.running:
-            dt = self.clock.tick(settings.FPS) / 1000
-            for event in pygame.event.get():
+            if render:
+                accumulator = min(accumulator + self.clock.tick(settings.FPS) / 1000, max_backlog)
+            else:
+                accumulator = step
+            self.profiler.begin_frame()
+            for event in self.input.poll(self.ticks):
                 if event.type == pygame.QUIT:
                     self.running = False
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                    self.profiler_overlay.toggle()
                 else:
                     self.state_machine.handle_event(event)
 
-            self.state_machine.update(dt)
-            self.state_machine.draw(self.screen)
-            pygame.display.flip()
+            while accumulator >= step and self.running:
+                self.state_machine.update(step)
+                self.ticks += 1
+                accumulator -= step
+                steps_run += 1
+                if max_steps is not None and steps_run >= max_steps:
+                    self.running = False
+
+            self.assets.pump()
+            if render:
+                self.render_alpha = accumulator / step
+                self.state_machine.draw(self.screen)
+                self.profiler_overlay.draw(self.screen, self.state_machine.current_name)
+                start = time.perf_counter()
+                pygame.display.flip()
+                self.profiler.record(self.state_machine.current_name, "flip", time.perf_counter() - start)
+            self.profiler.end_frame(self.state_machine.current_name)
+            if self.profiler.frame_count == 1:
+                self._mark("first frame")
+                self.startup_times["total to first frame"] = time.perf_counter() - self._created
+            elif render and self.preload:
+                # Warm one unused state per frame instead of all of them up front.
+                self.state_machine.preload_next()
 
+        world = self.state_machine.states.get("world")
+        if world is not None and world.grid is not None:
+            # Keep the play since the last timed autosave.
+            self.autosave()
+        self.autosaver.close()
+        if world is not None:
+            world.close()
         pygame.quit()
 
 
-if __name__ == "__main__":
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=settings.TITLE)
+    parser.add_argument("--headless", action="store_true", help="run without a window, driven by a bot")
+    parser.add_argument("--ticks", type=int, default=10000, help="simulation steps to run when headless")
+    parser.add_argument("--bot-seed", type=int, default=None, help="seed for the headless input bot")
+    parser.add_argument("--seed", type=int, default=None, help="seed for every gameplay random stream")
+    parser.add_argument("--record", metavar="PATH", help="save the run's seed and input to a replay file")
+    parser.add_argument("--replay", metavar="PATH", help="play back a recorded run")
+    parser.add_argument("--profile", metavar="PATH", help="export frame timings to a .csv or .json file")
+    parser.add_argument("--startup-report", action="store_true", help="print startup and state build times on exit")
+    parser.add_argument("--no-preload", action="store_true", help="only build states when they are first shown")
+    return parser.parse_args(argv)
+
+
+def build_app(args: argparse.Namespace) -> Tuple[GameApp, int | None]:
+    """The app the command line asks for, and how many steps to run it for."""
+    max_steps = args.ticks if args.headless else None
+    if args.replay:
+        replay = Replay.load(args.replay)
+        app = GameApp(headless=args.headless, input_source=replay.input(), seed=replay.seed, preload=not args.no_preload)
+        max_steps = replay.ticks
+    else:
+        app = GameApp(
+            headless=args.headless,
+            seed=args.seed,
+            preload=not args.no_preload,
+            resumable=not (args.headless or args.record),
+        )
+        if args.headless:
+            app.input = RandomInput(app, seed=args.bot_seed)
+    if args.record:
+        app.input = InputRecorder(app.rng.seed, app.input)
+    return app, max_steps
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    args = parse_args(argv)
     os.environ.setdefault("SDL_VIDEO_CENTERED", "1")
-    GameApp().run()
+    app, max_steps = build_app(args)
+
+    if args.profile:
+        app.profiler.stream_to(args.profile)
+    start = time.perf_counter()
+    app.run(max_steps=max_steps)
+    elapsed = time.perf_counter() - start
+    if args.record:
+        app.input.save(args.record, app.ticks)
+    if args.profile:
+        app.profiler.close()
+    if args.startup_report:
+        print(app.startup_report())
+    if app.headless:
+        print(f"{app.ticks} ticks in {elapsed:.2f}s ({app.ticks / elapsed:.0f} ticks/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from game.core import save
+from game.core.floors import FILE_HEADER, FloorArchive
+from game.core.world import generate_dungeon
+from main import GameApp
+
+
+def archive_with_floor(path):
+    grid, rooms = generate_dungeon(7)
+    archive = FloorArchive(str(path), reset=True)
+    archive.append(grid, rooms, seed=7)
+    archive.close()
+    return grid
+
+
+@pytest.mark.parametrize("keep", [FILE_HEADER.size + 4, FILE_HEADER.size + 40, -10])
+def test_truncated_archive_raises_value_error(tmp_path, keep):
+    path = tmp_path / "floors.bin"
+    archive_with_floor(path)
+    data = path.read_bytes()
+    path.write_bytes(data[:keep])
+    with pytest.raises(ValueError):
+        FloorArchive(str(path))
+
+
+def test_resume_with_damaged_archive_uses_saved_tiles():
+    app = GameApp(headless=True, seed=3)
+    world = app.state_machine.get("world")
+    app.state_machine.get("menu").start_new_game()
+    tiles = world.grid.tiles.copy()
+    app.autosave()
+    app.autosaver.close()
+    data = save.load(app.autosaver.path)
+    world.set_archive(None)
+
+    with open(world.floor_archive_path(), "r+b") as handle:
+        handle.truncate(FILE_HEADER.size + 4)
+    world.restore(data.world)
+    assert np.array_equal(world.grid.tiles, tiles)
+    assert len(world.floors) == 1
@@ -0,0 +1,66 @@
+import random
+
+import pytest
+
+from game.core.combat import CombatSimulator
+from game.core.entities import PlayerCharacter, instantiate_enemy
+from game.core.initiative import ROUND_TIME, TurnScheduler
+from game.data.classes import BASE_ARCHETYPES
+from game.data.enemies import ENEMIES
+
+
+class Actor:
+    pass
+
+
+def turn_times(scheduler: TurnScheduler, actor: Actor, count: int):
+    times = []
+    for _ in range(count):
+        assert scheduler.pop() is actor
+        times.append(scheduler.now)
+        scheduler.reschedule(actor)
+    return times
+
+
+@pytest.mark.parametrize("agility", [1, 8, 12, 20, 40])
+def test_first_turn_falls_in_first_round(agility):
+    scheduler = TurnScheduler()
+    scheduler.add(Actor(), agility)
+    assert scheduler.peek_time() < ROUND_TIME
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("enemy", sorted(ENEMIES))
+def test_one_round_gives_every_combatant_a_turn(enemy, seed):
+    # Vanguard's stun legitimately cancels an enemy's pending action, so it
+    # sits this one out.
+    party = [PlayerCharacter(name, archetype) for name, archetype in BASE_ARCHETYPES.items() if name != "Vanguard"]
+    enemies = [instantiate_enemy(enemy), instantiate_enemy(enemy)]
+    for foe in enemies:
+        foe.hp = 10_000
+    simulator = CombatSimulator(party, enemies, rng=random.Random(seed))
+    simulator.run_round()
+
+    actors = {entry.actor for entry in simulator.log}
+    assert {hero.codename for hero in party} <= actors
+    hits = [entry for entry in simulator.log if entry.actor == enemy and entry.action.startswith("hits")]
+    assert len(hits) >= len(enemies)
+
+
+def test_slow_lasts_for_its_full_duration():
+    plain, slowed = TurnScheduler(), TurnScheduler()
+    a, b = Actor(), Actor()
+    plain.add(a, 12)
+    slowed.add(b, 12)
+    slowed.haste(b, 0.5, 1)
+    base = turn_times(plain, a, 4)
+    times = turn_times(slowed, b, 4)
+    assert times[1] - times[0] == 2 * (base[1] - base[0])
+    assert times[2] - times[1] == base[2] - base[1]
+
+    slowed = TurnScheduler()
+    slowed.add(b, 12)
+    slowed.haste(b, 0.5, 3)
+    times = turn_times(slowed, b, 5)
+    gaps = [later - earlier for earlier, later in zip(times, times[1:])]
+    assert gaps == [2 * ROUND_TIME] * 3 + [ROUND_TIME]
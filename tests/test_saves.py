@@ -0,0 +1,52 @@
+import os
+
+import pytest
+
+import main
+from game import settings
+from game.core import save
+from game.core.entities import PlayerCharacter
+from game.data.classes import BASE_ARCHETYPES
+
+
+def headless_run(argv):
+    app, max_steps = main.build_app(main.parse_args(argv))
+    app.run(max_steps=max_steps)
+    return app, save.encode(save.snapshot(app))
+
+
+def test_headless_run_ignores_existing_save(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "SAVE_DIR", str(tmp_path))
+    argv = ["--headless", "--ticks", "1500", "--seed", "5", "--bot-seed", "3"]
+    app, fresh = headless_run(argv)
+    assert not app.resumable
+    assert not any(tmp_path.iterdir())
+
+    hero = PlayerCharacter("Saved-1", BASE_ARCHETYPES["Vanguard"])
+    data = save.SaveData(9, 999, [save.snapshot_hero(hero)], {}, {})
+    save_path = tmp_path / settings.AUTOSAVE_FILE
+    save.save(str(save_path), data)
+    before = save_path.read_bytes()
+
+    _, with_save = headless_run(argv)
+    assert with_save == fresh
+    assert save_path.read_bytes() == before
+    assert sorted(os.listdir(tmp_path)) == [settings.AUTOSAVE_FILE]
+
+
+def test_autosaver_survives_unencodable_snapshot(tmp_path):
+    hero = PlayerCharacter("Broken", BASE_ARCHETYPES["Skysage"])
+    hero.level = -1
+    autosaver = save.Autosaver(str(tmp_path / "autosave.sav"))
+    autosaver.submit(save.SaveData(1, 0, [save.snapshot_hero(hero)], {}, {}))
+    autosaver.close()
+    assert autosaver.error is not None
+    assert autosaver.saves_written == 0
+    autosaver.close()
+
+
+def test_restore_party_rejects_unknown_items():
+    record = save.snapshot_hero(PlayerCharacter("Hero", BASE_ARCHETYPES["Riftblade"]))
+    record.equipped["weapon"] = "Long Lost Blade"
+    with pytest.raises(ValueError):
+        save.restore_party([record])
@@ -0,0 +1,49 @@
+import random
+
+import pytest
+
+from game.core.combat import CombatSimulator
+from game.core.entities import PlayerCharacter, instantiate_enemy
+from game.data.classes import BASE_ARCHETYPES
+from game.data.items import ITEMS
+
+
+def hero():
+    return PlayerCharacter("Hero", BASE_ARCHETYPES["Riftblade"])
+
+
+@pytest.mark.parametrize("turns", [1, 2, 3])
+def test_buff_boosts_exactly_its_duration(turns):
+    fighter = hero()
+    fighter.add_buff("Fury", {"strength": 100}, turns)
+    enemy = instantiate_enemy("Vault Sentry")
+    enemy.hp = 100_000
+    simulator = CombatSimulator([fighter], [enemy], initiative=False, rng=random.Random(1))
+    for _ in range(turns + 3):
+        simulator.run_round()
+    strikes = [entry.value for entry in simulator.log if entry.action == "strikes"]
+    assert sum(value >= 100 for value in strikes) == turns
+    assert fighter.stats["strength"] == fighter.base_stats["strength"]
+
+
+def test_bonus_changes_shift_current_hp():
+    fighter = hero()
+    full = fighter.stats["hp"]
+    fighter.add_buff("Vigour", {"hp": 10}, 1)
+    assert fighter.stats["hp"] == full + 10
+    assert fighter.max_hp == full + 10 + fighter.level * 5
+    fighter.stats["hp"] -= 25
+    fighter.tick_buffs()
+    assert fighter.stats["hp"] == full - 25
+    assert fighter.max_hp == full + fighter.level * 5
+
+
+def test_equipping_keeps_damage_taken():
+    fighter = hero()
+    fighter.stats["hp"] -= 30
+    damaged = fighter.stats["hp"]
+    bonus = ITEMS["Guardian Bulwark"].stats["hp"]
+    fighter.equip("shield", "Guardian Bulwark")
+    assert fighter.stats["hp"] == damaged + bonus
+    fighter.equip("shield", "")
+    assert fighter.stats["hp"] == damaged